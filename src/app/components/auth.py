@@ -1,21 +1,106 @@
 """Authentication Components for March Dashboard"""
 
+import threading
+import time
+from collections import OrderedDict
+from functools import lru_cache
+from types import MappingProxyType
 
 import dash
 import dash_bootstrap_components as dbc
 from dash import Input, Output, State, callback, html
+from flask import session
 from flask_login import login_user, logout_user
 
 from src.app.utils.auth import authenticate_user
 
+# FontAwesome 5 solid glyphs, rendered as text so icons don't need an extra <i> component
+ICONS = {
+    'info-circle': '\uf05a',
+    'shield-alt': '\uf3ed',
+    'user': '\uf007',
+    'key': '\uf084',
+    'sign-in-alt': '\uf2f6',
+    'sign-out-alt': '\uf2f5',
+    'crown': '\uf521',
+    'user-shield': '\uf505',
+    'ban': '\uf05e',
+    'clock': '\uf017',
+    'exclamation-triangle': '\uf071',
+    'times-circle': '\uf057',
+}
 
+# Role badge with professional icons (read-only, built once at import)
+ROLE_CONFIG = MappingProxyType({
+    'admin': {'icon': 'crown', 'label': 'Admin', 'color': 'danger'},
+    'supervisor': {'icon': 'user-shield', 'label': 'Supervisor', 'color': 'warning'},
+    'participant': {'icon': 'user', 'label': 'Participant', 'color': 'info'}
+})
+DEFAULT_ROLE = MappingProxyType({'icon': 'user', 'label': 'User', 'color': 'secondary'})
+
+
+# Failed-login throttle: after MAX_FAILED_LOGINS failures within the window,
+# further attempts for that username are rejected without checking the password
+MAX_FAILED_LOGINS = 5
+FAILED_LOGIN_WINDOW_S = 60.0
+# Upper bound on tracked usernames, so probing many names cannot grow memory unbounded
+MAX_TRACKED_LOGINS = 10_000
+
+# username -> (failure count, monotonic time of first failure in window), kept in
+# order of first failure so expired (and, at the cap, oldest) entries are at the front
+_fail_counts: OrderedDict[str, tuple[int, float]] = OrderedDict()
+_fail_lock = threading.Lock()
+
+
+def _is_login_throttled(username: str, now: float) -> bool:
+    """Check whether a username has too many recent failed logins"""
+    with _fail_lock:
+        count, first_failure = _fail_counts.get(username, (0, now))
+        if now - first_failure > FAILED_LOGIN_WINDOW_S:
+            del _fail_counts[username]
+            return False
+        return count >= MAX_FAILED_LOGINS
+
+
+def _record_failed_login(username: str, now: float):
+    """Count a failed login, starting a new window if the last one expired"""
+    with _fail_lock:
+        # Drop expired windows; they sit at the front since entries are in first-failure order
+        while _fail_counts:
+            oldest, (_, first_failure) = next(iter(_fail_counts.items()))
+            if now - first_failure <= FAILED_LOGIN_WINDOW_S:
+                break
+            del _fail_counts[oldest]
+
+        count, first_failure = _fail_counts.get(username, (0, now))
+        _fail_counts[username] = (count + 1, first_failure)
+
+        if len(_fail_counts) > MAX_TRACKED_LOGINS:
+            _fail_counts.popitem(last=False)
+
+
+def _clear_failed_logins(username: str):
+    """Forget failed logins for a username after it logs in successfully"""
+    with _fail_lock:
+        _fail_counts.pop(username, None)
+
+
+def _icon(name: str, class_name: str = ""):
+    """Render a FontAwesome icon glyph as a single span"""
+    return html.Span(ICONS[name], className=f"fas {class_name}".strip())
+
+
+# The static layouts below are cached, so every call returns the same component
+# tree. Callers must not mutate the result (set props, append children); build a
+# new component around it instead.
+@lru_cache(maxsize=4)
 def create_login_form(debug: bool = False):
-    """Create login form component"""
+    """Create login form component (cached and shared: do not mutate)"""
 
     debug_info = dbc.Alert(
         [
             html.H6(
-                [html.I(className="fas fa-info-circle me-2"), "Development Dashboard"],
+                [_icon("info-circle", "me-2"), "Development Dashboard"],
                 className="alert-heading",
             ),
             html.P(
@@ -35,7 +120,7 @@ def create_login_form(debug: bool = False):
                 dbc.Card([
                     dbc.CardHeader([
                         html.H4([
-                            html.I(className="fas fa-shield-alt me-3"),
+                            _icon("shield-alt", "me-3"),
                             "Dashboard Login"
                         ], className="text-center mb-0 text-white")
                     ], className="bg-gradient-primary text-white py-3"),
@@ -44,7 +129,7 @@ def create_login_form(debug: bool = False):
 
                         dbc.Form([
                             dbc.InputGroup([
-                                dbc.InputGroupText(html.I(className="fas fa-user")),
+                                dbc.InputGroupText(_icon("user")),
                                 dbc.Input(
                                     id="login-username",
                                     placeholder="Username",
@@ -55,7 +140,7 @@ def create_login_form(debug: bool = False):
                             ], className="mb-3"),
 
                             dbc.InputGroup([
-                                dbc.InputGroupText(html.I(className="fas fa-key")),
+                                dbc.InputGroupText(_icon("key")),
                                 dbc.Input(
                                     id="login-password",
                                     placeholder="Password",
@@ -65,7 +150,7 @@ def create_login_form(debug: bool = False):
                             ], className="mb-3"),
 
                             dbc.Button(
-                                [html.I(className="fas fa-sign-in-alt me-2"), "Login"],
+                                [_icon("sign-in-alt", "me-2"), "Login"],
                                 id="login-submit-btn",
                                 color="primary",
                                 size="lg",
@@ -86,37 +171,30 @@ def create_login_form(debug: bool = False):
 
 def create_user_info_dropdown(user):
     """Create user info dropdown for navigation"""
-    if not user or not hasattr(user, 'username'):
+    if user is None or getattr(user, 'username', None) is None:
         return html.Div()
 
-    # Role badge with professional icons
-    role_config = {
-        'admin': {'icon': 'fas fa-crown', 'label': 'Admin', 'color': 'danger'},
-        'supervisor': {'icon': 'fas fa-user-shield', 'label': 'Supervisor', 'color': 'warning'},
-        'participant': {'icon': 'fas fa-user', 'label': 'Participant', 'color': 'info'}
-    }
-
-    role_info = role_config.get(user.role, {'icon': 'fas fa-user', 'label': 'User', 'color': 'secondary'})
+    role_info = ROLE_CONFIG.get(user.role, DEFAULT_ROLE)
 
     return dbc.DropdownMenu(
         children=[
             dbc.DropdownMenuItem([
                 dbc.Badge([
-                    html.I(className=f"{role_info['icon']} me-1"),
+                    _icon(role_info['icon'], "me-1"),
                     role_info['label']
                 ], color=role_info['color'], className="me-2"),
                 user.display_name
             ], header=True),
             dbc.DropdownMenuItem(divider=True),
             dbc.DropdownMenuItem([
-                html.I(className="fas fa-sign-out-alt me-2"),
+                _icon("sign-out-alt", "me-2"),
                 "Logout"
             ], id="logout-btn", className="text-danger")
         ],
         nav=True,
         in_navbar=True,
         label=[
-            html.I(className=f"{role_info['icon']} me-2"),
+            _icon(role_info['icon'], "me-2"),
             user.display_name
         ],
         align_end=True,
@@ -124,14 +202,15 @@ def create_user_info_dropdown(user):
     )
 
 
+@lru_cache(maxsize=4)
 def create_access_denied(message: str = None):
-    """Create access denied component"""
+    """Create access denied component (cached per message and shared: do not mutate)"""
     return dbc.Container([
         dbc.Row([
             dbc.Col([
                 dbc.Alert([
                     html.H4([
-                        html.I(className="fas fa-ban me-2"),
+                        _icon("ban", "me-2"),
                         "Access Denied"
                     ], className="alert-heading"),
                     html.P(message or "You don't have permission to view this content."),
@@ -140,7 +219,7 @@ def create_access_denied(message: str = None):
                         "Please log in with appropriate credentials or contact your administrator.",
                     ], className="mb-3"),
                     dbc.Button([
-                        html.I(className="fas fa-sign-in-alt me-2"),
+                        _icon("sign-in-alt", "me-2"),
                         "Go to Login"
                     ], href="/login", color="primary", className="btn-professional")
                 ], color="danger")
@@ -149,15 +228,16 @@ def create_access_denied(message: str = None):
     ])
 
 
+@lru_cache(maxsize=4)
 def create_loading_spinner():
-    """Create loading spinner component"""
+    """Create loading spinner component (cached and shared: do not mutate)"""
     return dbc.Container([
         dbc.Row([
             dbc.Col([
                 html.Div([
                     dbc.Spinner(color="primary", size="lg"),
                     html.P([
-                        html.I(className="fas fa-clock me-2"),
+                        _icon("clock", "me-2"),
                         "Loading..."
                     ], className="mt-3 text-muted")
                 ], className="text-center loading-container")
@@ -166,6 +246,17 @@ def create_loading_spinner():
     ])
 
 
+def _login_failed_alert():
+    """Create the invalid credentials alert"""
+    return dbc.Alert([
+        html.Strong([
+            _icon("times-circle", "me-2"),
+            "Login Failed"
+        ]), html.Br(),
+        "Invalid username or password. Please check your credentials and try again."
+    ], color="danger", className="mb-3")
+
+
 # Authentication callbacks
 @callback(
     [Output('login-error-message', 'children'),
@@ -187,28 +278,28 @@ def handle_login(n_clicks, n_submit, username, password):
 
     if not username or not password:
         error_alert = dbc.Alert([
-            html.I(className="fas fa-exclamation-triangle me-2"),
+            _icon("exclamation-triangle", "me-2"),
             "Please enter both username and password"
         ], color="danger", className="mb-3")
         return error_alert, dash.no_update
 
+    now = time.monotonic()
+    if _is_login_throttled(username, now):
+        return _login_failed_alert(), dash.no_update
+
     user_data = authenticate_user(username, password)
 
     if user_data:
-        # Import User class from main
+        _clear_failed_logins(username)
+        # Imported here because src.app.main imports this module; after the
+        # first login this is a cached sys.modules lookup
         from src.app.main import User
         user = User(user_data)
         login_user(user, remember=False)
         return "", "/"  # Redirect to main page
     else:
-        error_alert = dbc.Alert([
-            html.Strong([
-                html.I(className="fas fa-times-circle me-2"),
-                "Login Failed"
-            ]), html.Br(),
-            "Invalid username or password. Please check your credentials and try again."
-        ], color="danger", className="mb-3")
-        return error_alert, dash.no_update
+        _record_failed_login(username, now)
+        return _login_failed_alert(), dash.no_update
 
 
 @callback(
@@ -219,7 +310,6 @@ def handle_login(n_clicks, n_submit, username, password):
 def handle_logout(n_clicks):
     """Handle logout and clear session"""
     if n_clicks:
-        from flask import session
         # Logout the user (removes user from Flask-Login)
         logout_user()
         # Clear the entire Flask session (removes server-side session data)
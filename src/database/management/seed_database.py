@@ -4,14 +4,77 @@ Simplified database seeding script for FitonDuty March Dashboard
 Creates one completed march with time-series data for development testing
 """
 
-import math
+import io
 import os
-import random
 from datetime import date
 
+import numpy as np
 from sqlalchemy import create_engine, text
 from werkzeug.security import generate_password_hash
 
+try:
+    import sqlparse
+
+    HAS_SQLPARSE = True
+except ImportError:
+    HAS_SQLPARSE = False
+
+
+# Columns bulk-loaded with COPY, in row order
+TIMESERIES_COLUMNS = (
+    "march_id",
+    "user_id",
+    "timestamp_minutes",
+    "heart_rate",
+    "step_rate",
+    "estimated_speed_kmh",
+    "cumulative_steps",
+    "cumulative_distance_km",
+    "core_temp",
+)
+GPS_COLUMNS = (
+    "march_id",
+    "user_id",
+    "timestamp_minutes",
+    "latitude",
+    "longitude",
+    "elevation",
+    "speed_kmh",
+    "bearing",
+)
+
+# printf formats for the per-row data columns (after march_id, user_id), matching
+# each column's INTEGER or NUMERIC scale in schema.sql
+TIMESERIES_FORMATS = ("%d", "%d", "%d", "%.2f", "%d", "%.2f", "%.2f")
+GPS_FORMATS = ("%.2f", "%.7f", "%.7f", "%.2f", "%.2f", "%.2f")
+
+# Execution options for running schema SQL verbatim through the driver
+RAW_SQL = {"no_parameters": True}
+
+# Per-participant statements, built once and reused on every loop iteration
+INSERT_PARTICIPANT = text("""
+    INSERT INTO march_participants (march_id, user_id, completed, start_offset_minutes, finish_time_minutes)
+    VALUES (:march_id, :user_id, true, :start_offset, :finish_time)
+""")
+INSERT_HEALTH_METRICS = text("""
+    INSERT INTO march_health_metrics
+    (march_id, user_id, avg_hr, max_hr, avg_core_temp, total_steps, march_duration_minutes,
+     estimated_distance_km, avg_pace_kmh, effort_score, recovery_hr, data_completeness)
+    VALUES (:march_id, :user_id, :avg_hr, :max_hr, :avg_core_temp, :total_steps, :march_duration_minutes,
+            :estimated_distance_km, :avg_pace_kmh, :effort_score, :recovery_hr, :data_completeness)
+    RETURNING id
+""")
+INSERT_HR_ZONES = text("""
+    INSERT INTO march_hr_zones
+    (march_health_metric_id, very_light_percent, light_percent, moderate_percent, intense_percent, beast_mode_percent)
+    VALUES (:metric_id, :very_light, :light, :moderate, :intense, :beast_mode)
+""")
+INSERT_MOVEMENT_SPEEDS = text("""
+    INSERT INTO march_movement_speeds
+    (march_health_metric_id, walking_minutes, walking_fast_minutes, jogging_minutes, running_minutes, stationary_minutes)
+    VALUES (:metric_id, :walking_minutes, :walking_fast_minutes, :jogging_minutes, :running_minutes, :stationary_minutes)
+""")
+
 
 def get_database_url():
     """Get database URL from environment or use default"""
@@ -30,9 +93,11 @@ def create_tables(engine):
         schema_sql = f.read()
 
     with engine.connect() as conn:
-        # Execute entire schema as one transaction first
+        # Execute entire schema as one transaction first, sent as a single
+        # multi-statement string. no_parameters keeps the driver from treating
+        # '%' in SQL comments as a placeholder
         try:
-            conn.execute(text(schema_sql))
+            conn.exec_driver_sql(schema_sql, execution_options=RAW_SQL)
             conn.commit()
             print("✓ Schema executed as single transaction")
         except Exception as e:
@@ -42,15 +107,20 @@ def create_tables(engine):
             # Rollback any partial transaction
             conn.rollback()
 
-            # Fallback: execute statements individually, skip on error
-            statements = [stmt.strip() for stmt in schema_sql.split(";") if stmt.strip()]
+            # Fallback: execute statements individually, skip on error. sqlparse splits
+            # SQL-aware (quoted semicolons, function bodies) when it is installed
+            if HAS_SQLPARSE:
+                statements = [stmt.strip().rstrip(";") for stmt in sqlparse.split(schema_sql)]
+            else:
+                statements = [stmt.strip() for stmt in schema_sql.split(";")]
+            statements = [stmt for stmt in statements if stmt]
             successful_statements = 0
             skipped_statements = 0
 
             for statement in statements:
                 if statement and not statement.startswith("--"):
                     try:
-                        conn.execute(text(statement))
+                        conn.exec_driver_sql(statement, execution_options=RAW_SQL)
                         successful_statements += 1
                     except Exception as stmt_error:
                         if ("already exists" in str(stmt_error) or
@@ -69,12 +139,40 @@ def create_tables(engine):
     print("✓ Tables created successfully")
 
 
+def copy_columns(conn, table, columns, key_values, arrays, formats):
+    """Bulk-load column arrays into a table with COPY, inside the connection's transaction
+
+    ``key_values`` fill the leading columns with the same value on every row;
+    ``arrays`` hold the remaining columns and are formatted with ``formats``.
+    """
+    row_format = ",".join([*(str(value) for value in key_values), *formats])
+    buffer = io.StringIO()
+    np.savetxt(buffer, np.column_stack(arrays), fmt=row_format)
+    buffer.seek(0)
+
+    cursor = conn.connection.cursor()
+    try:
+        cursor.copy_expert(
+            f"COPY {table} ({', '.join(columns)}) FROM STDIN WITH (FORMAT csv)", buffer
+        )
+    finally:
+        cursor.close()
+
+
 def seed_basic_data(conn):
-    """Create test users, group, and single march event"""
+    """Create test users, group, and single march event
+
+    Returns the new march ID and the participant user IDs.
+    """
     print("Seeding basic data...")
 
-    # Create password hash for all test users (password: test123)
-    password_hash = generate_password_hash("test123")
+    # Create password hash for all test users (password: test123), once for all users.
+    # Werkzeug's default strong hashing is used unless FITONDUTY_ENV=dev is set
+    # explicitly; then a single PBKDF2 iteration keeps seeding fast (NOT secure).
+    if os.environ.get("FITONDUTY_ENV") == "dev":
+        password_hash = generate_password_hash("test123", method="pbkdf2:sha256:1", salt_length=4)
+    else:
+        password_hash = generate_password_hash("test123")
 
     # Insert users - keep it simple
     users_data = [
@@ -85,72 +183,60 @@ def seed_basic_data(conn):
         {"username": "participant4", "role": "participant"},
     ]
 
-    # Insert users first
-    for user_data in users_data:
-        conn.execute(
-            text("""
-            INSERT INTO users (username, password_hash, role) 
-            VALUES (:username, :password_hash, :role)
-            ON CONFLICT (username) DO NOTHING
-        """),
-            {**user_data, "password_hash": password_hash},
-        )
-
-    # Commit users before creating groups to ensure foreign key constraint is satisfied
-    conn.commit()
-
-    # Get the admin user ID to use as created_by
+    # Insert all users in one statement; the role update on conflict makes RETURNING
+    # yield existing users too, so no follow-up SELECTs are needed for their IDs
     result = conn.execute(
-        text("SELECT id FROM users WHERE username = 'admin'")
+        text("""
+        INSERT INTO users (username, password_hash, role)
+        SELECT username, :password_hash, role
+        FROM unnest(CAST(:usernames AS text[]), CAST(:roles AS text[])) AS u(username, role)
+        ON CONFLICT (username) DO UPDATE SET role = EXCLUDED.role
+        RETURNING id, username, role
+    """),
+        {
+            "password_hash": password_hash,
+            "usernames": [user_data["username"] for user_data in users_data],
+            "roles": [user_data["role"] for user_data in users_data],
+        },
     )
-    admin_user_id = result.fetchone()[0]
+    user_rows = result.fetchall()
+    admin_user_id = next(row.id for row in user_rows if row.username == "admin")
+    participant_ids = sorted(row.id for row in user_rows if row.role == "participant")
 
-    # Create one group with the correct admin user ID
-    conn.execute(
+    # Create one group with the correct admin user ID; the no-op update on conflict
+    # makes RETURNING yield the existing group's ID on re-runs
+    group_id = conn.execute(
         text("""
         INSERT INTO groups (group_name, description, created_by) 
         VALUES ('Training Squad', 'Main training group for march testing', :admin_id)
-        ON CONFLICT (group_name) DO NOTHING
+        ON CONFLICT (group_name) DO UPDATE SET group_name = EXCLUDED.group_name
+        RETURNING id
     """),
         {"admin_id": admin_user_id}
-    )
-
-    # Commit the group creation before proceeding
-    conn.commit()
-
-    # Get the group ID dynamically
-    result = conn.execute(
-        text("SELECT id FROM groups WHERE group_name = 'Training Squad'")
-    )
-    group_id = result.fetchone()[0]
-
-    # Get participant user IDs dynamically
-    result = conn.execute(
-        text("SELECT id FROM users WHERE role = 'participant' ORDER BY id")
-    )
-    participant_ids = [row[0] for row in result.fetchall()]
+    ).scalar_one()
 
     # Assign participants to group using dynamic group_id
-    for user_id in participant_ids:
-        conn.execute(
-            text("""
-            INSERT INTO user_groups (user_id, group_id) 
-            VALUES (:user_id, :group_id)
-            ON CONFLICT (user_id, group_id) DO NOTHING
-        """),
-            {"user_id": user_id, "group_id": group_id},
-        )
+    conn.execute(
+        text("""
+        INSERT INTO user_groups (user_id, group_id) 
+        VALUES (:user_id, :group_id)
+        ON CONFLICT (user_id, group_id) DO NOTHING
+    """),
+        [{"user_id": user_id, "group_id": group_id} for user_id in participant_ids],
+    )
 
     # Create one completed march using dynamic group_id and admin_user_id
-    conn.execute(
+    march_id = conn.execute(
         text("""
         INSERT INTO march_events (name, date, duration_hours, distance_km, route_description, group_id, status, created_by)
         VALUES ('Training March Alpha', :march_date, 2.5, 8.2, 'Forest trail with moderate elevation - completed march', :group_id, 'published', :admin_id)
+        RETURNING id
     """),
         {"march_date": date(2024, 3, 15), "group_id": group_id, "admin_id": admin_user_id},
-    )
+    ).scalar_one()
 
     print("✓ Basic data seeded")
+    return march_id, participant_ids
 
 
 def generate_gps_track(user_id, duration_minutes, distance_km):
@@ -161,175 +247,168 @@ def generate_gps_track(user_id, duration_minutes, distance_km):
     base_lat = 40.7128 + (user_id % 4) * 0.001  # Slightly different start for each participant
     base_lon = -74.0060 + (user_id % 4) * 0.001
 
-    gps_data = []
-
-    # Set random seed for consistent routes per user
-    random.seed(user_id * 100)
+    # Random generator seeded for consistent routes per user
+    rng = np.random.default_rng(user_id * 100)
 
     # Calculate points (every 30 seconds for smoother routes)
     num_points = duration_minutes * 2  # 2 points per minute
+    progress = np.arange(num_points) / num_points
 
     # Route parameters
-    bearing = random.uniform(0, 360)  # Initial direction
-    elevation = 100 + random.uniform(-10, 10)  # Starting elevation
-
-    for i in range(num_points):
-        progress = i / num_points
-
-        # Time in minutes (fractional)
-        timestamp_minutes = (i * 0.5)  # 0.5 minutes = 30 seconds
-
-        # Calculate movement
-        # Distance per point (km)
-        point_distance = (distance_km / num_points) * (1.0 + random.uniform(-0.1, 0.1))
-
-        # Bearing changes (simulate turns and terrain following)
-        bearing_change = random.uniform(-15, 15) + 5 * math.sin(progress * 8 * math.pi)
-        bearing = (bearing + bearing_change) % 360
-
-        # Convert bearing and distance to lat/lon change
-        # Approximate: 1 degree lat ≈ 111 km, 1 degree lon ≈ 111 km * cos(lat)
-        lat_change = point_distance * math.cos(math.radians(bearing)) / 111.0
-        lon_change = point_distance * math.sin(math.radians(bearing)) / (111.0 * math.cos(math.radians(base_lat)))
-
-        base_lat += lat_change
-        base_lon += lon_change
-
-        # Elevation changes (simulate terrain)
-        elevation_change = random.uniform(-2, 2) + 3 * math.sin(progress * 6 * math.pi)
-        elevation += elevation_change
-        elevation = max(50, min(300, elevation))  # Keep elevation reasonable
+    initial_bearing = rng.uniform(0, 360)  # Initial direction
+    initial_elevation = 100 + rng.uniform(-10, 10)  # Starting elevation
+
+    # Time in minutes (fractional), 0.5 minutes = 30 seconds
+    timestamp_minutes = np.arange(num_points) * 0.5
+
+    # Distance per point (km)
+    point_distance = (distance_km / num_points) * (1.0 + rng.uniform(-0.1, 0.1, num_points))
+
+    # Bearing changes (simulate turns and terrain following), accumulated along the track
+    bearing_change = rng.uniform(-15, 15, num_points) + 5 * np.sin(progress * 8 * np.pi)
+    bearing = (initial_bearing + np.cumsum(bearing_change)) % 360
+
+    # Convert bearing and distance to lat/lon change
+    # Approximate: 1 degree lat ≈ 111 km, 1 degree lon ≈ 111 km * cos(lat)
+    bearing_rad = np.radians(bearing)
+    latitude = base_lat + np.cumsum(point_distance * np.cos(bearing_rad) / 111.0)
+    # Longitude scale uses the latitude before each step
+    previous_lat = np.concatenate(([base_lat], latitude[:-1]))
+    longitude = base_lon + np.cumsum(
+        point_distance * np.sin(bearing_rad) / (111.0 * np.cos(np.radians(previous_lat)))
+    )
 
-        # Calculate speed (km/h) from distance and time
-        speed_kmh = (point_distance / (0.5 / 60))  # distance / time_in_hours
-        speed_kmh = max(0.5, min(8.0, speed_kmh))  # Reasonable marching speed
+    # Elevation changes (simulate terrain)
+    elevation_change = rng.uniform(-2, 2, num_points) + 3 * np.sin(progress * 6 * np.pi)
+    elevation = initial_elevation + np.cumsum(elevation_change)
+    elevation = np.clip(elevation, 50, 300)  # Keep elevation reasonable
 
-        gps_data.append({
-            'timestamp_minutes': round(timestamp_minutes, 2),
-            'latitude': round(base_lat, 7),
-            'longitude': round(base_lon, 7),
-            'elevation': round(elevation, 2),
-            'speed_kmh': round(speed_kmh, 2),
-            'bearing': round(bearing, 2)
-        })
+    # Calculate speed (km/h) from distance and time
+    speed_kmh = point_distance / (0.5 / 60)  # distance / time_in_hours
+    speed_kmh = np.clip(speed_kmh, 0.5, 8.0)  # Reasonable marching speed
 
-    return gps_data
+    # One array per column (structure of arrays)
+    return {
+        'timestamp_minutes': np.round(timestamp_minutes, 2),
+        'latitude': np.round(latitude, 7),
+        'longitude': np.round(longitude, 7),
+        'elevation': np.round(elevation, 2),
+        'speed_kmh': np.round(speed_kmh, 2),
+        'bearing': np.round(bearing, 2)
+    }
 
 
 def generate_march_timeseries(user_id, duration_minutes, distance_km):
     """Generate realistic time-series data for a participant during march"""
 
     # Participant characteristics (based on user_id for consistency)
-    random.seed(user_id * 42)  # Consistent randomness per user
+    rng = np.random.default_rng(user_id * 42)  # Consistent randomness per user
     base_fitness = 0.7 + (user_id % 4) * 0.1  # 0.7 to 1.0
-    base_hr = 60 + random.randint(5, 15)  # Resting HR
+    base_hr = 60 + int(rng.integers(5, 16))  # Resting HR
     max_hr = 200 - (user_id * 5)  # Age-based max HR
-    base_core_temp = 36.5 + random.uniform(-0.2, 0.2)  # Normal resting core temp
-
-    timeseries_data = []
-
-    # Generate data points every 5 minutes
-    for minute in range(0, duration_minutes + 1, 5):
-        progress = minute / duration_minutes if duration_minutes > 0 else 0
-
-        # Heart rate progression (starts moderate, peaks in middle, recovers slightly at end)
-        hr_intensity = 0.5 + 0.3 * math.sin(progress * math.pi) + 0.1 * random.random()
-        hr_intensity = max(0.4, min(0.9, hr_intensity))  # Keep in reasonable range
-        heart_rate = int(base_hr + (max_hr - base_hr) * hr_intensity * (1.1 - base_fitness * 0.2))
-
-        # Core body temperature (increases with exertion, influenced by HR and duration)
-        # Temperature rises gradually during march, peaks mid-way, slight decrease at end
-        temp_increase = 1.5 * hr_intensity * (1.0 - base_fitness * 0.3)  # Fitter people regulate better
-        temp_variation = 0.15 * math.sin(progress * 2 * math.pi) + random.uniform(-0.1, 0.1)
-        core_temp = base_core_temp + temp_increase + temp_variation
-        core_temp = max(36.0, min(39.5, core_temp))  # Keep in physiological range
-
-        # Step rate (varies with terrain and fatigue)
-        terrain_factor = 1.0 + 0.2 * math.sin(progress * 4 * math.pi)  # Terrain variations
-        fatigue_factor = 1.0 - 0.15 * progress  # Gradual slowdown
-        base_step_rate = 110 + random.randint(-10, 10)
-        step_rate = int(base_step_rate * terrain_factor * fatigue_factor * base_fitness)
-
-        # Estimated speed (correlated with step rate and HR)
-        speed_base = 3.0 + base_fitness * 1.5  # Base speed 3-4.5 km/h
-        speed_variation = 0.5 * math.sin(progress * 3 * math.pi) * terrain_factor
-        estimated_speed = max(
-            0.5, speed_base + speed_variation - 0.8 * progress
-        )  # Slow down over time
-
-        # Cumulative metrics
-        if minute == 0:
-            cumulative_steps = 0
-            cumulative_distance = 0.0
-        else:
-            steps_this_interval = step_rate * 5  # 5 minutes
-            distance_this_interval = estimated_speed * (5 / 60)  # 5 minutes in hours
-            cumulative_steps = cumulative_steps + steps_this_interval
-            cumulative_distance = cumulative_distance + distance_this_interval
-
-        timeseries_data.append(
-            {
-                "timestamp_minutes": minute,
-                "heart_rate": heart_rate,
-                "step_rate": step_rate,
-                "estimated_speed_kmh": round(estimated_speed, 2),
-                "cumulative_steps": int(cumulative_steps),
-                "cumulative_distance_km": round(cumulative_distance, 2),
-                "core_temp": round(core_temp, 2),
-            }
-        )
+    base_core_temp = 36.5 + rng.uniform(-0.2, 0.2)  # Normal resting core temp
+
+    # Generate data points every 5 minutes, computing each signal for all points at once
+    minutes = np.arange(0, duration_minutes + 1, 5)
+    num_points = minutes.size
+    progress = minutes / duration_minutes if duration_minutes > 0 else np.zeros(num_points)
+
+    # Heart rate progression (starts moderate, peaks in middle, recovers slightly at end)
+    hr_intensity = 0.5 + 0.3 * np.sin(progress * np.pi) + 0.1 * rng.random(num_points)
+    hr_intensity = np.clip(hr_intensity, 0.4, 0.9)  # Keep in reasonable range
+    heart_rate = (
+        base_hr + (max_hr - base_hr) * hr_intensity * (1.1 - base_fitness * 0.2)
+    ).astype(np.int64)
+
+    # Core body temperature (increases with exertion, influenced by HR and duration)
+    # Temperature rises gradually during march, peaks mid-way, slight decrease at end
+    temp_increase = 1.5 * hr_intensity * (1.0 - base_fitness * 0.3)  # Fitter people regulate better
+    temp_variation = 0.15 * np.sin(progress * 2 * np.pi) + rng.uniform(-0.1, 0.1, num_points)
+    core_temp = base_core_temp + temp_increase + temp_variation
+    core_temp = np.clip(core_temp, 36.0, 39.5)  # Keep in physiological range
+
+    # Step rate (varies with terrain and fatigue)
+    terrain_factor = 1.0 + 0.2 * np.sin(progress * 4 * np.pi)  # Terrain variations
+    fatigue_factor = 1.0 - 0.15 * progress  # Gradual slowdown
+    base_step_rate = 110 + rng.integers(-10, 11, num_points)
+    step_rate = (base_step_rate * terrain_factor * fatigue_factor * base_fitness).astype(np.int64)
+
+    # Estimated speed (correlated with step rate and HR)
+    speed_base = 3.0 + base_fitness * 1.5  # Base speed 3-4.5 km/h
+    speed_variation = 0.5 * np.sin(progress * 3 * np.pi) * terrain_factor
+    estimated_speed = np.maximum(
+        0.5, speed_base + speed_variation - 0.8 * progress
+    )  # Slow down over time
+
+    # Cumulative metrics: prefix sums over 5-minute intervals, starting at 0 for minute 0
+    steps_per_interval = step_rate * 5
+    steps_per_interval[0] = 0
+    distance_per_interval = estimated_speed * (5 / 60)  # 5 minutes in hours
+    distance_per_interval[0] = 0.0
+    cumulative_steps = np.cumsum(steps_per_interval)
+    cumulative_distance = np.cumsum(distance_per_interval)
+
+    # One array per column (structure of arrays)
+    return {
+        "timestamp_minutes": minutes,
+        "heart_rate": heart_rate,
+        "step_rate": step_rate,
+        "estimated_speed_kmh": np.round(estimated_speed, 2),
+        "cumulative_steps": cumulative_steps,
+        "cumulative_distance_km": np.round(cumulative_distance, 2),
+        "core_temp": np.round(core_temp, 2),
+    }
 
-    return timeseries_data
 
+def calculate_summary_metrics(timeseries_data, duration_minutes, rng=None):
+    """Calculate summary metrics from time-series data
 
-def calculate_summary_metrics(timeseries_data, duration_minutes):
-    """Calculate summary metrics from time-series data"""
+    ``rng`` is a NumPy Generator for the randomized estimates; pass a seeded one
+    for reproducible output.
+    """
+    if rng is None:
+        rng = np.random.default_rng()
 
-    if not timeseries_data:
+    heart_rate = timeseries_data["heart_rate"]
+    if heart_rate.size == 0:
         return None
 
     # Heart rate metrics
-    hr_values = [d["heart_rate"] for d in timeseries_data if d["heart_rate"]]
-    avg_hr = int(sum(hr_values) / len(hr_values)) if hr_values else 0
-    max_hr = max(hr_values) if hr_values else 0
+    hr_values = heart_rate[heart_rate > 0]
+    avg_hr = int(hr_values.mean()) if hr_values.size else 0
+    max_hr = int(hr_values.max()) if hr_values.size else 0
 
     # Core temperature metrics
-    temp_values = [d["core_temp"] for d in timeseries_data if d.get("core_temp")]
-    avg_core_temp = round(sum(temp_values) / len(temp_values), 2) if temp_values else 37.0
+    temp_values = timeseries_data["core_temp"]
+    temp_values = temp_values[temp_values > 0]
+    avg_core_temp = round(float(temp_values.mean()), 2) if temp_values.size else 37.0
 
     # Final cumulative values
-    final_data = timeseries_data[-1]
-    total_steps = final_data["cumulative_steps"]
-    estimated_distance = final_data["cumulative_distance_km"]
+    total_steps = int(timeseries_data["cumulative_steps"][-1])
+    estimated_distance = float(timeseries_data["cumulative_distance_km"][-1])
     avg_pace = (estimated_distance / (duration_minutes / 60.0)) if duration_minutes > 0 else 0
 
     # Effort score (simple calculation based on HR intensity and duration)
-    effort_score = (avg_hr / 180.0) * (duration_minutes / 60.0) * 100 * random.uniform(0.9, 1.1)
+    effort_score = (avg_hr / 180.0) * (duration_minutes / 60.0) * 100 * rng.uniform(0.9, 1.1)
 
     # Recovery HR (estimate)
-    recovery_hr = int(avg_hr * random.uniform(0.7, 0.85))
+    recovery_hr = int(avg_hr * rng.uniform(0.7, 0.85))
 
     # HR zones (simplified distribution based on avg HR)
     hr_max_est = max_hr * 1.05  # Estimate max HR
     zone_thresholds = [0.5, 0.6, 0.7, 0.8, 0.9]  # Zone boundaries as % of max HR
 
-    zone_counts = [0] * 5
-    for data_point in timeseries_data:
-        hr = data_point["heart_rate"]
-        hr_percent = hr / hr_max_est if hr_max_est > 0 else 0
-
-        zone_idx = 0
-        for i, threshold in enumerate(zone_thresholds):
-            if hr_percent >= threshold:
-                zone_idx = i
-        zone_counts[zone_idx] += 1
+    # Zone index is the highest threshold reached; anything below 50% counts as zone 0
+    hr_percent = heart_rate / hr_max_est if hr_max_est > 0 else np.zeros(heart_rate.size)
+    zone_idx = np.clip(np.digitize(hr_percent, zone_thresholds) - 1, 0, 4)
+    zone_counts = np.bincount(zone_idx, minlength=5)
 
     # Convert to percentages
-    total_points = sum(zone_counts)
-    hr_zones = [count / total_points * 100 if total_points > 0 else 0 for count in zone_counts]
+    total_points = int(zone_counts.sum())
+    hr_zones = (zone_counts / total_points * 100).tolist() if total_points > 0 else [0] * 5
 
     # Movement speed analysis (simplified)
-    avg_speed = sum(d["estimated_speed_kmh"] for d in timeseries_data) / len(timeseries_data)
+    avg_speed = float(timeseries_data["estimated_speed_kmh"].mean())
     walking_ratio = 0.6 if avg_speed < 3.5 else 0.4
     walking_fast_ratio = 0.3 if avg_speed < 4.0 else 0.5
     jogging_ratio = 0.1 if avg_speed > 4.0 else 0.05
@@ -357,21 +436,23 @@ def calculate_summary_metrics(timeseries_data, duration_minutes):
     }
 
 
-def seed_march_data(conn):
-    """Create march participants with realistic time-series and summary data"""
-    print("Seeding march performance data...")
+def generate_participant_data(user_id, duration_minutes, distance_km):
+    """Generate time-series, GPS track and summary metrics for one participant
 
-    # Get the march ID dynamically
-    result = conn.execute(
-        text("SELECT id FROM march_events WHERE name = 'Training March Alpha'")
+    Pure computation with no database access, so it can be mapped over participants
+    independently (including in worker processes).
+    """
+    timeseries_data = generate_march_timeseries(user_id, duration_minutes, distance_km)
+    summary_metrics = calculate_summary_metrics(
+        timeseries_data, duration_minutes, rng=np.random.default_rng(user_id * 7)
     )
-    march_id = result.fetchone()[0]
+    gps_track = generate_gps_track(user_id, duration_minutes, distance_km)
+    return timeseries_data, gps_track, summary_metrics
 
-    # Get participant user IDs dynamically
-    result = conn.execute(
-        text("SELECT id FROM users WHERE role = 'participant' ORDER BY id")
-    )
-    participant_ids = [row[0] for row in result.fetchall()]
+
+def seed_march_data(conn, march_id, participant_ids):
+    """Create march participants with realistic time-series and summary data"""
+    print("Seeding march performance data...")
 
     # Create participant performance data with varying durations
     durations = [140, 155, 170, 145]  # good, average, slower, good performance
@@ -380,40 +461,36 @@ def seed_march_data(conn):
         duration = durations[i] if i < len(durations) else 150  # Default duration
         participants.append({"user_id": user_id, "duration": duration})
 
-    for participant in participants:
+    # Local generator so start offsets are reproducible and don't touch global state
+    offset_rng = np.random.default_rng(march_id)
+
+    # Generate every participant's data up front, separate from the inserts below.
+    # This takes about a millisecond per participant, so it is not worth a process pool.
+    distance_km = 8.2  # Fixed distance for this march
+    generated = [
+        generate_participant_data(p["user_id"], p["duration"], distance_km) for p in participants
+    ]
+
+    for participant, (timeseries_data, gps_track, summary_metrics) in zip(
+        participants, generated, strict=True
+    ):
         user_id = participant["user_id"]
         duration_minutes = participant["duration"]
-        distance_km = 8.2  # Fixed distance for this march
 
         # Add participant record
         conn.execute(
-            text("""
-            INSERT INTO march_participants (march_id, user_id, completed, start_offset_minutes, finish_time_minutes)
-            VALUES (:march_id, :user_id, true, :start_offset, :finish_time)
-        """),
+            INSERT_PARTICIPANT,
             {
                 "march_id": march_id,
                 "user_id": user_id,
-                "start_offset": random.randint(0, 3),
+                "start_offset": int(offset_rng.integers(0, 4)),
                 "finish_time": duration_minutes,
             },
         )
 
-        # Generate time-series data
-        timeseries_data = generate_march_timeseries(user_id, duration_minutes, distance_km)
-
-        # Calculate summary metrics
-        summary_metrics = calculate_summary_metrics(timeseries_data, duration_minutes)
-
-        # Insert summary health metrics
-        conn.execute(
-            text("""
-            INSERT INTO march_health_metrics
-            (march_id, user_id, avg_hr, max_hr, avg_core_temp, total_steps, march_duration_minutes,
-             estimated_distance_km, avg_pace_kmh, effort_score, recovery_hr, data_completeness)
-            VALUES (:march_id, :user_id, :avg_hr, :max_hr, :avg_core_temp, :total_steps, :march_duration_minutes,
-                    :estimated_distance_km, :avg_pace_kmh, :effort_score, :recovery_hr, :data_completeness)
-        """),
+        # Insert summary health metrics and get the new metric ID
+        metric_id = conn.execute(
+            INSERT_HEALTH_METRICS,
             {
                 "march_id": march_id,
                 "user_id": user_id,
@@ -424,26 +501,12 @@ def seed_march_data(conn):
                     if k not in ["hr_zones", "movement_speeds"]
                 },
             },
-        )
-
-        # Get the health metric ID
-        result = conn.execute(
-            text("""
-            SELECT id FROM march_health_metrics 
-            WHERE march_id = :march_id AND user_id = :user_id
-        """),
-            {"march_id": march_id, "user_id": user_id},
-        )
-        metric_id = result.fetchone()[0]
+        ).scalar_one()
 
         # Insert HR zones
         hr_zones = summary_metrics["hr_zones"]
         conn.execute(
-            text("""
-            INSERT INTO march_hr_zones 
-            (march_health_metric_id, very_light_percent, light_percent, moderate_percent, intense_percent, beast_mode_percent)
-            VALUES (:metric_id, :very_light, :light, :moderate, :intense, :beast_mode)
-        """),
+            INSERT_HR_ZONES,
             {
                 "metric_id": metric_id,
                 "very_light": round(hr_zones[0], 1),
@@ -457,38 +520,31 @@ def seed_march_data(conn):
         # Insert movement speeds
         movement = summary_metrics["movement_speeds"]
         conn.execute(
-            text("""
-            INSERT INTO march_movement_speeds 
-            (march_health_metric_id, walking_minutes, walking_fast_minutes, jogging_minutes, running_minutes, stationary_minutes)
-            VALUES (:metric_id, :walking_minutes, :walking_fast_minutes, :jogging_minutes, :running_minutes, :stationary_minutes)
-        """),
+            INSERT_MOVEMENT_SPEEDS,
             {"metric_id": metric_id, **movement},
         )
 
-        # Insert time-series data
-        for data_point in timeseries_data:
-            conn.execute(
-                text("""
-                INSERT INTO march_timeseries_data
-                (march_id, user_id, timestamp_minutes, heart_rate, step_rate, estimated_speed_kmh, cumulative_steps, cumulative_distance_km, core_temp)
-                VALUES (:march_id, :user_id, :timestamp_minutes, :heart_rate, :step_rate, :estimated_speed_kmh, :cumulative_steps, :cumulative_distance_km, :core_temp)
-            """),
-                {"march_id": march_id, "user_id": user_id, **data_point},
-            )
-
-        # Generate and insert GPS track data
-        gps_track = generate_gps_track(user_id, duration_minutes, distance_km)
-        for gps_point in gps_track:
-            conn.execute(
-                text("""
-                INSERT INTO march_gps_positions
-                (march_id, user_id, timestamp_minutes, latitude, longitude, elevation, speed_kmh, bearing)
-                VALUES (:march_id, :user_id, :timestamp_minutes, :latitude, :longitude, :elevation, :speed_kmh, :bearing)
-            """),
-                {"march_id": march_id, "user_id": user_id, **gps_point},
-            )
-
-        print(f"✓ Generated data for participant{user_id - 1} ({duration_minutes} min march, {len(gps_track)} GPS points)")
+        # Bulk-load time-series data
+        copy_columns(
+            conn,
+            "march_timeseries_data",
+            TIMESERIES_COLUMNS,
+            (march_id, user_id),
+            [timeseries_data[col] for col in TIMESERIES_COLUMNS[2:]],
+            TIMESERIES_FORMATS,
+        )
+
+        # Bulk-load GPS track data
+        copy_columns(
+            conn,
+            "march_gps_positions",
+            GPS_COLUMNS,
+            (march_id, user_id),
+            [gps_track[col] for col in GPS_COLUMNS[2:]],
+            GPS_FORMATS,
+        )
+
+        print(f"✓ Generated data for participant{user_id - 1} ({duration_minutes} min march, {gps_track['timestamp_minutes'].size} GPS points)")
 
     print("✓ March performance data seeded with time-series")
 
@@ -505,11 +561,17 @@ def main():
         # Create tables
         create_tables(engine)
 
-        # Seed data
-        with engine.connect() as conn:
-            seed_basic_data(conn)
-            seed_march_data(conn)
-            conn.commit()
+        # Seed data in a single transaction, committed once at the end
+        with engine.begin() as conn:
+            # Bulk-load setting scoped to this transaction: don't wait for the WAL flush
+            conn.execute(text("SET LOCAL synchronous_commit = off"))
+
+            march_id, participant_ids = seed_basic_data(conn)
+            seed_march_data(conn, march_id, participant_ids)
+
+            # Refresh planner statistics for the bulk-loaded tables
+            for table in ("march_timeseries_data", "march_gps_positions"):
+                conn.execute(text(f"ANALYZE {table}"))
 
         print("\n✅ Database seeding completed successfully!")
         print("\nTest scenario:")
@@ -11,6 +11,8 @@ from src.processing.filters import (
     highpass_filter,
     lowpass_filter,
     ppg_filter,
+    segment_argmax,
+    segment_argmin,
 )
 
 __all__ = [
@@ -20,4 +22,6 @@ __all__ = [
     "acceleration_filter",
     "ppg_filter",
     "find_peaks_and_minimas_np",
+    "segment_argmax",
+    "segment_argmin",
 ]
@@ -28,6 +28,8 @@ import numpy as np
 import pandas as pd
 from sqlalchemy import create_engine, text
 
+from src.processing.parsers import read_timeseries_csv
+
 
 def get_database_url(args):
     """Get database URL from arguments or environment"""
@@ -54,14 +56,19 @@ def create_db_engine(db_url):
 
 
 def load_csv_file(data_dir, filename):
-    """Load a CSV file if it exists"""
+    """Load a CSV file if it exists, or its Parquet counterpart"""
     file_path = Path(data_dir) / filename
-    if not file_path.exists():
+    parquet_path = file_path.with_suffix('.parquet')
+    if not file_path.exists() and not parquet_path.exists():
         print(f"  ⚠️  File not found: {filename}")
         return None
 
     try:
-        df = pd.read_csv(file_path)
+        if file_path.exists():
+            df = read_timeseries_csv(file_path)
+        else:
+            filename = parquet_path.name
+            df = pd.read_parquet(parquet_path)
         print(f"  ✓ Loaded {filename}: {len(df)} rows")
         return df
     except Exception as e:
@@ -160,6 +167,14 @@ def to_python_type(value):
     return value
 
 
+def first_present(*values):
+    """Return the first value that is not None/NaN/NA, or None"""
+    for value in values:
+        if value is not None and pd.notna(value):
+            return value
+    return None
+
+
 def to_int(value):
     """Convert value to integer, handling None/NaN"""
     converted = to_python_type(value)
@@ -392,8 +407,8 @@ def load_march_timeseries_data(conn, df, march_id):
             'timestamp_minutes': timestamp_minutes,
             'heart_rate': to_int(row.get('heart_rate')),  # INTEGER
             'step_rate': to_int(row.get('step_rate')),  # INTEGER
-            'estimated_speed_kmh': to_decimal(row.get('speed_kmh') or row.get('estimated_speed_kmh'), 2, max_value=99.99),  # NUMERIC(4,2) - max 99.99
-            'cumulative_steps': to_int(row.get('steps') or row.get('cumulative_steps')),  # INTEGER
+            'estimated_speed_kmh': to_decimal(first_present(row.get('speed_kmh'), row.get('estimated_speed_kmh')), 2, max_value=99.99),  # NUMERIC(4,2) - max 99.99
+            'cumulative_steps': to_int(first_present(row.get('steps'), row.get('cumulative_steps'))),  # INTEGER
             'cumulative_distance_km': to_decimal(row.get('cumulative_distance_km'), 2, max_value=999.99)  # NUMERIC(5,2) - max 999.99
         })
 
@@ -26,8 +26,26 @@ import sys
 from pathlib import Path
 from typing import Optional
 
+import numpy as np
 import pandas as pd
 
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    HAS_PYARROW = True
+except ImportError:
+    HAS_PYARROW = False
+
+try:
+    import polars as pl
+
+    HAS_POLARS = True
+except ImportError:
+    HAS_POLARS = False
+
+from src.processing.parsers import csv_datetime_format, read_timeseries_csv
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
@@ -35,6 +53,14 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Columns read from the step and summary inputs (plus the merge column for step data);
+# everything else in those files is never used, so it is not parsed
+STEP_DATA_COLUMNS = ('march_id', 'user_id', 'cumulative_steps', 'steps_per_second')
+STEP_SUMMARY_COLUMNS = ('march_id', 'user_id', 'total_steps', 'avg_steps_per_second',
+                        'window_size_seconds')
+TEMP_SUMMARY_COLUMNS = ('march_id', 'user_id', 'avg_core_temp', 'min_core_temp',
+                        'max_core_temp', 'temp_readings_count')
+
 
 class MarchDataMerger:
     """Merge watch and step data into unified timeseries"""
@@ -97,6 +123,12 @@ class MarchDataMerger:
             else:
                 self.tolerance = 1.0  # 1 minute
 
+        # Tolerance in the merge column's units, as passed to the asof joins
+        if merge_on == 'timestamp':
+            self._tolerance = pd.Timedelta(seconds=self.tolerance)
+        else:
+            self._tolerance = self.tolerance
+
     def load_data(self) -> tuple[pd.DataFrame, pd.DataFrame]:
         """
         Load watch and step data from CSV files
@@ -106,19 +138,36 @@ class MarchDataMerger:
         tuple[pd.DataFrame, pd.DataFrame]
             Watch data and step data DataFrames
         """
+        # All watch columns are carried into the merged output
         logger.info(f"Loading watch data from {self.watch_data_file}")
-        df_watch = pd.read_csv(self.watch_data_file)
+        df_watch = read_timeseries_csv(self.watch_data_file)
         logger.info(f"Loaded {len(df_watch)} watch data records")
 
+        # Only the step columns used by the merge are parsed
         logger.info(f"Loading step data from {self.step_data_file}")
-        df_steps = pd.read_csv(self.step_data_file)
+        df_steps = read_timeseries_csv(
+            self.step_data_file, columns={*STEP_DATA_COLUMNS, self.merge_on}
+        )
         logger.info(f"Loaded {len(df_steps)} step data records")
 
-        # Parse timestamp columns
+        # Timestamps are usually parsed on read already; normalize both to nanoseconds
+        # so merge_asof sees matching key dtypes
         if 'timestamp' in df_watch.columns:
-            df_watch['timestamp'] = pd.to_datetime(df_watch['timestamp'])
+            df_watch['timestamp'] = pd.to_datetime(df_watch['timestamp']).astype('datetime64[ns]')
         if 'timestamp' in df_steps.columns:
-            df_steps['timestamp'] = pd.to_datetime(df_steps['timestamp'])
+            df_steps['timestamp'] = pd.to_datetime(df_steps['timestamp']).astype('datetime64[ns]')
+
+        # Participant keys repeat on every row: store user_id as a categorical with one
+        # shared (sorted) set of categories so both frames use identical codes, and
+        # downcast march_id to the smallest integer type. Missing user_ids are not
+        # categories; they stay null in the categorical column.
+        user_ids = pd.Index(
+            np.concatenate([df_watch['user_id'].to_numpy(), df_steps['user_id'].to_numpy()])
+        )
+        user_dtype = pd.CategoricalDtype(user_ids.dropna().unique().sort_values())
+        for df in (df_watch, df_steps):
+            df['user_id'] = df['user_id'].astype(user_dtype)
+            df['march_id'] = pd.to_numeric(df['march_id'], downcast='integer')
 
         return df_watch, df_steps
 
@@ -145,7 +194,9 @@ class MarchDataMerger:
         if 'steps_per_second' in df_steps.columns:
             merge_cols.append('steps_per_second')
 
-        df_steps_merge = df_steps[merge_cols].copy()
+        # The column selection already returns a new frame and nothing below mutates it
+        # in place, so no extra copy is needed
+        df_steps_merge = df_steps[merge_cols]
 
         # Rename columns to avoid conflicts
         rename_map = {}
@@ -160,22 +211,18 @@ class MarchDataMerger:
         logger.info(f"Prepared step data with columns: {df_steps_merge.columns.tolist()}")
         return df_steps_merge
 
-    def _estimate_steps_from_distance(self, merged: pd.DataFrame, user_id: str, march_id: int) -> pd.DataFrame:
+    def _estimate_steps_from_distance(self, merged: pd.DataFrame) -> pd.DataFrame:
         """
         Estimate steps from cumulative distance using calculated average stride length
 
-        Strategy:
+        Strategy (per participant, computed for all participants at once):
         1. Calculate average stride length: total_distance / total_steps
         2. For rows with distance but no steps: estimated_steps = cumulative_distance / avg_stride_length
 
         Parameters
         ----------
         merged : pd.DataFrame
-            Merged data with steps_acc and cumulative_distance_km columns
-        user_id : str
-            User/participant ID (for logging)
-        march_id : int
-            March event ID (for logging)
+            Merged data for all participants with steps_acc and cumulative_distance_km columns
 
         Returns
         -------
@@ -186,196 +233,338 @@ class MarchDataMerger:
         if 'cumulative_distance_km' not in merged.columns:
             return merged
 
-        # Find rows with both distance and steps (for calculating stride length)
-        has_both = (
-            merged['cumulative_distance_km'].notna() &
-            merged['steps_acc'].notna() &
-            (merged['cumulative_distance_km'] > 0) &
-            (merged['steps_acc'] > 0)
-        )
+        participant_keys = ['march_id', 'user_id']
+        distance_km = merged['cumulative_distance_km']
+        steps_acc = merged['steps_acc']
+
+        # Find rows with both distance and steps (for calculating stride length);
+        # comparisons with NaN are False, so this also requires both to be present
+        has_both = distance_km.gt(0) & steps_acc.gt(0)
 
         if not has_both.any():
             # No rows with both distance and steps to calculate stride length
             return merged
 
-        # Calculate average stride length using the maximum values (most reliable)
-        # This gives us the overall average stride length for this participant
-        max_distance_km = merged.loc[has_both, 'cumulative_distance_km'].max()
-        max_steps = merged.loc[has_both, 'steps_acc'].max()
-
-        if max_distance_km > 0 and max_steps > 0:
-            # Convert distance to meters
-            max_distance_m = max_distance_km * 1000
-
-            # Calculate average stride length in meters
-            avg_stride_length_m = max_distance_m / max_steps
-
-            # Sanity check: typical stride length is 0.4m to 1.5m
-            if 0.4 <= avg_stride_length_m <= 1.5:
-                # Find rows with distance but no steps
-                needs_estimation = (
-                    merged['cumulative_distance_km'].notna() &
-                    merged['steps_acc'].isna() &
-                    (merged['cumulative_distance_km'] > 0)
-                )
-
-                if needs_estimation.any():
-                    # Estimate steps: cumulative_steps = cumulative_distance / stride_length
-                    distance_m = merged.loc[needs_estimation, 'cumulative_distance_km'] * 1000
-                    estimated_steps = distance_m / avg_stride_length_m
-
-                    # Update the steps column with estimates
-                    merged.loc[needs_estimation, 'steps'] = estimated_steps
-
-                    estimated_count = needs_estimation.sum()
-                    logger.info(f"  Estimated steps for {estimated_count} rows using stride length {avg_stride_length_m:.2f}m")
-                    logger.info(f"    (calculated from {max_distance_km:.2f}km / {int(max_steps)} steps)")
-            else:
-                logger.warning(f"  Invalid stride length {avg_stride_length_m:.2f}m - skipping estimation")
+        # Calculate each participant's average stride length in meters using the
+        # maximum values (most reliable)
+        maxima = (
+            merged.loc[has_both, [*participant_keys, 'cumulative_distance_km', 'steps_acc']]
+            .groupby(participant_keys, observed=True)
+            .max()
+        )
+        stride_length_m = maxima['cumulative_distance_km'] * 1000 / maxima['steps_acc']
+
+        # Sanity check: typical stride length is 0.4m to 1.5m
+        valid = stride_length_m.between(0.4, 1.5)
+        for (march_id, user_id), stride in stride_length_m[~valid].items():
+            logger.warning(f"  Invalid stride length {stride:.2f}m for {user_id} in march {march_id} - skipping estimation")
+        stride_length_m = stride_length_m[valid]
+
+        # Broadcast each participant's stride length to its rows (NaN if none)
+        row_stride_m = stride_length_m.reindex(
+            pd.MultiIndex.from_frame(merged[participant_keys])
+        ).to_numpy()
+
+        # Find rows with distance but no steps, for participants with a valid stride length
+        needs_estimation = distance_km.gt(0) & steps_acc.isna() & pd.notna(row_stride_m)
+
+        if needs_estimation.any():
+            # Estimate steps: cumulative_steps = cumulative_distance / stride_length
+            distance_m = distance_km[needs_estimation] * 1000
+            merged.loc[needs_estimation, 'steps'] = distance_m / row_stride_m[needs_estimation.to_numpy()]
+
+            estimated_participants = merged.loc[needs_estimation, participant_keys].drop_duplicates()
+            logger.info(
+                f"  Estimated steps for {int(needs_estimation.sum())} rows across "
+                f"{len(estimated_participants)} participants using stride length"
+            )
 
         return merged
 
-    def merge_participant_data(self, watch_group: pd.DataFrame,
-                               step_group: pd.DataFrame,
-                               march_id: int, user_id: str) -> pd.DataFrame:
+    def merge_data(self, df_watch: pd.DataFrame, df_steps: pd.DataFrame) -> pd.DataFrame:
         """
-        Merge watch and step data for a single participant
+        Merge watch and step data for all participants
 
-        Uses a LEFT JOIN approach - all watch data is preserved, step data is added where available.
+        Uses LEFT JOIN - all watch data is preserved, step data is added where available.
+        This ensures participants with watch data but no step data are still included.
+        All participants are matched in a single merge_asof call keyed by march and user.
 
         Parameters
         ----------
-        watch_group : pd.DataFrame
-            Watch data for this participant
-        step_group : pd.DataFrame
-            Step data for this participant
-        march_id : int
-            March event ID
-        user_id : str
-            User/participant ID
+        df_watch : pd.DataFrame
+            Watch data
+        df_steps : pd.DataFrame
+            Step data
 
         Returns
         -------
         pd.DataFrame
-            Merged data for this participant (all watch records preserved)
+            Merged data (all watch records preserved), ordered by participant and time
         """
-        watch_records = len(watch_group)
-
-        if step_group.empty:
-            logger.warning(f"No step data found for {user_id} in march {march_id} - keeping all {watch_records} watch records")
-            return watch_group
+        logger.info(f"Merging data on column: {self.merge_on}")
+        logger.info(f"Input: {len(df_watch)} watch records, {len(df_steps)} step records")
 
-        # Determine tolerance for merge_asof
-        if self.merge_on == 'timestamp':
-            tolerance = pd.Timedelta(seconds=self.tolerance)
-        else:
-            tolerance = self.tolerance
+        # Prepare step data
+        df_steps_merge = self.prepare_step_data(df_steps)
 
-        # Merge using merge_asof (LEFT JOIN - preserves all watch data)
-        # This keeps ALL rows from watch_group and adds matching step data where available
+        participant_keys = ['march_id', 'user_id']
+        watch_rows = pd.MultiIndex.from_frame(df_watch[participant_keys])
+        watch_participants = watch_rows.unique()
+        step_participants = pd.MultiIndex.from_frame(df_steps_merge[participant_keys]).unique()
+        total_participants = len(watch_participants)
+        has_steps = watch_participants.isin(step_participants)
+        participants_with_steps = int(has_steps.sum())
+        for march_id, user_id in watch_participants[~has_steps]:
+            logger.warning(f"No step data found for {user_id} in march {march_id} - keeping all watch records")
+
+        # Only participants with step data go through merge_asof; the watch records of
+        # the others are kept as they are
+        watch_has_steps = watch_rows.isin(step_participants)
+
+        # Merge using merge_asof (LEFT JOIN - preserves all watch data). The 'by' keys
+        # restrict matches to the same participant; both sides must be sorted on the
+        # merge column across all participants
         merged = pd.merge_asof(
-            watch_group.sort_values(self.merge_on),
-            step_group.sort_values(self.merge_on),
+            df_watch[watch_has_steps].sort_values(self.merge_on),
+            df_steps_merge.sort_values(self.merge_on),
             on=self.merge_on,
-            by=['march_id', 'user_id'],
+            by=participant_keys,
             direction='nearest',
-            tolerance=tolerance
+            tolerance=self._tolerance
         )
+        if not watch_has_steps.all():
+            merged = pd.concat([merged, df_watch[~watch_has_steps]], ignore_index=True)
+
+        # Group rows by participant, each participant's rows in time order
+        merged = merged.sort_values([*participant_keys, self.merge_on], kind='stable', ignore_index=True)
 
         # Verify we didn't lose any watch records
-        if len(merged) != watch_records:
-            logger.warning(f"  Warning: Expected {watch_records} records, got {len(merged)}")
+        if len(merged) != len(df_watch):
+            logger.warning(f"  Warning: Expected {len(df_watch)} records, got {len(merged)}")
 
         # Replace watch steps with accelerometer steps if available
         if 'steps_acc' in merged.columns:
             # Count how many rows have step data
             step_count = merged['steps_acc'].notna().sum()
-            logger.info(f"  Matched {step_count}/{watch_records} records with step data ({step_count/watch_records*100:.1f}%)")
+            logger.info(f"  Matched {step_count}/{len(merged)} records with step data ({step_count/len(merged)*100:.1f}%)")
 
             # Replace steps column where accelerometer data is available
             if 'steps' in merged.columns:
                 # Keep original watch steps where no accelerometer data
-                merged['steps'] = merged['steps_acc'].fillna(merged['steps'])
+                steps_acc = merged['steps_acc'].to_numpy(dtype='float64', na_value=np.nan)
+                watch_steps = merged['steps'].to_numpy(dtype='float64', na_value=np.nan)
+                merged['steps'] = np.where(np.isnan(steps_acc), watch_steps, steps_acc)
             else:
                 # No original steps, just use accelerometer data
                 merged['steps'] = merged['steps_acc']
 
             # Estimate steps from distance where step data is missing but distance is available
-            merged = self._estimate_steps_from_distance(merged, user_id, march_id)
+            merged = self._estimate_steps_from_distance(merged)
 
             merged = merged.drop(columns=['steps_acc'])
         else:
-            logger.info(f"  Kept all {watch_records} watch records (no step data matched)")
+            logger.info(f"  Kept all {len(merged)} watch records (no step data matched)")
 
         # Optionally keep sps_acc as additional column for reference
         if 'sps_acc' in merged.columns:
             # Rename for clarity
             merged = merged.rename(columns={'sps_acc': 'steps_per_second'})
 
+        logger.info(f"Merge complete:")
+        logger.info(f"  Total records: {len(merged)} (preserved all {len(df_watch)} watch records)")
+        logger.info(f"  Participants: {total_participants} total, {participants_with_steps} with step data")
+
         return merged
 
-    def merge_data(self, df_watch: pd.DataFrame, df_steps: pd.DataFrame) -> pd.DataFrame:
+    def merge_polars(self, output_dir: Path,
+                     output_filename: str = 'march_timeseries_data_merged.csv',
+                     output_format: str = 'csv') -> int:
         """
-        Merge watch and step data for all participants
+        Load, merge and save timeseries data as one Polars lazy query
 
-        Uses LEFT JOIN - all watch data is preserved, step data is added where available.
-        This ensures participants with watch data but no step data are still included.
+        Produces the same records as load_data, merge_data and save_merged_data,
+        but the CSV scans, column pruning, asof join and step estimation are planned
+        together and streamed to the output file by Polars' streaming engine.
 
         Parameters
         ----------
-        df_watch : pd.DataFrame
-            Watch data
-        df_steps : pd.DataFrame
-            Step data
+        output_dir : Path
+            Output directory
+        output_filename : str
+            Output filename (default: march_timeseries_data_merged.csv)
+        output_format : str
+            'csv' or 'parquet'; Parquet output is zstd-compressed and uses the
+            filename with a .parquet suffix (default: csv)
 
         Returns
         -------
-        pd.DataFrame
-            Merged data (all watch records preserved)
+        int
+            Number of merged records written
         """
-        logger.info(f"Merging data on column: {self.merge_on}")
-        logger.info(f"Input: {len(df_watch)} watch records, {len(df_steps)} step records")
+        if not HAS_POLARS:
+            raise ImportError("polars is required for the polars engine. Install: uv add polars")
+
+        logger.info(f"Merging data with polars on column: {self.merge_on}")
+        participant_keys = ['march_id', 'user_id']
+
+        lf_watch = pl.scan_csv(self.watch_data_file, try_parse_dates=True)
+        lf_steps = pl.scan_csv(self.step_data_file, try_parse_dates=True)
+        watch_columns = lf_watch.collect_schema().names()
+        step_columns = lf_steps.collect_schema().names()
+
+        # Only the step columns used by the merge are read, renamed to avoid conflicts
+        rename_map = {
+            col: new for col, new in (('cumulative_steps', 'steps_acc'), ('steps_per_second', 'sps_acc'))
+            if col in step_columns
+        }
+        lf_steps = lf_steps.select([*participant_keys, self.merge_on, *rename_map]).rename(rename_map)
+
+        # LEFT asof join per participant; both sides only need to be sorted on the
+        # merge column within each participant
+        merged = lf_watch.sort([*participant_keys, self.merge_on], maintain_order=True).join_asof(
+            lf_steps.sort([*participant_keys, self.merge_on]),
+            on=self.merge_on,
+            by=participant_keys,
+            strategy='nearest',
+            tolerance=self._tolerance,
+            check_sortedness=False
+        )
 
-        # Prepare step data
-        df_steps_merge = self.prepare_step_data(df_steps)
+        stride_plan = None
+        if 'steps_acc' in rename_map.values():
+            # Replace watch steps with accelerometer steps where available
+            if 'steps' in watch_columns:
+                steps = pl.coalesce('steps_acc', 'steps')
+            else:
+                steps = pl.col('steps_acc')
+            merged = merged.with_columns(steps.alias('steps'))
+
+            # Estimate missing steps from distance using each participant's stride length
+            if 'cumulative_distance_km' in watch_columns:
+                distance_km = pl.col('cumulative_distance_km')
+                has_both = (distance_km > 0) & (pl.col('steps_acc') > 0)
+                stride_length_m = (
+                    pl.when(has_both).then(distance_km).max().over(participant_keys) * 1000
+                    / pl.when(has_both).then(pl.col('steps_acc')).max().over(participant_keys)
+                )
+                needs_estimation = (
+                    (distance_km > 0) & pl.col('steps_acc').is_null() & stride_length_m.is_between(0.4, 1.5)
+                )
+                merged = merged.with_columns(
+                    pl.when(needs_estimation)
+                    .then(distance_km * 1000 / stride_length_m)
+                    .otherwise(pl.col('steps'))
+                    .alias('steps')
+                )
 
-        # Merge by march_id and user_id
-        merged_data = []
-        participant_groups = df_watch.groupby(['march_id', 'user_id'])
+                stride_plan = (
+                    merged.filter(has_both)
+                    .group_by(participant_keys)
+                    .agg((distance_km.max() * 1000 / pl.col('steps_acc').max()).alias('stride_length_m'))
+                    .filter(~pl.col('stride_length_m').is_between(0.4, 1.5))
+                    .sort(participant_keys)
+                )
 
-        total_participants = len(participant_groups)
-        participants_with_steps = 0
+            merged = merged.drop('steps_acc')
 
-        for (march_id, user_id), watch_group in participant_groups:
-            # Get corresponding step data
-            step_group = df_steps_merge[
-                (df_steps_merge['march_id'] == march_id) &
-                (df_steps_merge['user_id'] == user_id)
-            ]
+        if 'sps_acc' in rename_map.values():
+            merged = merged.rename({'sps_acc': 'steps_per_second'})
+
+        missing_plan = (
+            lf_watch.select(participant_keys).unique(maintain_order=True)
+            .join(lf_steps.select(participant_keys).unique(), on=participant_keys, how='anti')
+        )
 
-            if not step_group.empty:
-                participants_with_steps += 1
+        # Summary statistics are aggregated from the same plan that is streamed to disk,
+        # so the merged data is never materialized as a whole
+        summary_exprs = [
+            pl.len().alias('records'),
+            pl.col('user_id').n_unique().alias('participants'),
+            pl.col('march_id').n_unique().alias('marches'),
+        ]
+        if 'steps' in merged.collect_schema().names():
+            summary_exprs.append((pl.col('steps') > 0).sum().alias('step_records'))
+        if 'heart_rate' in watch_columns:
+            summary_exprs.append(pl.col('heart_rate').is_not_null().sum().alias('hr_records'))
 
-            # Merge this participant's data (LEFT JOIN preserves all watch data)
-            logger.info(f"Merging data for {user_id} in march {march_id}")
-            merged_group = self.merge_participant_data(
-                watch_group, step_group, march_id, user_id
+        output_dir = Path(output_dir)
+        output_dir.mkdir(parents=True, exist_ok=True)
+        output_file = output_dir / output_filename
+        if output_format == 'parquet':
+            output_file = output_file.with_suffix('.parquet')
+            sink = merged.sink_parquet(output_file, compression='zstd', lazy=True)
+        else:
+            # to_csv writes all timestamps in a column with the precision the column
+            # needs; it is read off the watch timestamps (the only datetimes in the
+            # output) before streaming
+            datetime_columns = [
+                name for name, dtype in lf_watch.collect_schema().items() if dtype == pl.Datetime
+            ]
+            time_of_day_ns = np.empty(0, dtype=np.int64)
+            if datetime_columns:
+                time_of_day_ns = pl.concat([
+                    lf_watch.select(pl.col(name).dt.time().cast(pl.Int64).alias('ns'))
+                    for name in datetime_columns
+                ]).drop_nulls().unique().collect()['ns'].to_numpy()
+            sink = merged.sink_csv(
+                output_file, datetime_format=csv_datetime_format(time_of_day_ns), lazy=True
             )
-            merged_data.append(merged_group)
 
-        # Combine all merged groups
-        df_merged = pd.concat(merged_data, ignore_index=True)
+        plans = [
+            sink,
+            merged.select(summary_exprs),
+            missing_plan,
+        ]
+        if stride_plan is not None:
+            plans.append(stride_plan)
+        _, df_summary, df_missing, *df_invalid = pl.collect_all(plans, engine='streaming')
 
-        logger.info(f"Merge complete:")
-        logger.info(f"  Total records: {len(df_merged)} (preserved all {len(df_watch)} watch records)")
-        logger.info(f"  Participants: {total_participants} total, {participants_with_steps} with step data")
+        for march_id, user_id in df_missing.iter_rows():
+            logger.warning(f"No step data found for {user_id} in march {march_id} - keeping all watch records")
+        for march_id, user_id, stride in (df_invalid[0].iter_rows() if df_invalid else ()):
+            logger.warning(f"  Invalid stride length {stride:.2f}m for {user_id} in march {march_id} - skipping estimation")
+
+        logger.info(f"Saved merged data to {output_file}")
 
-        return df_merged
+        # Print summary statistics
+        summary = df_summary.row(0, named=True)
+        records = summary['records']
+        logger.info("Merged data summary:")
+        logger.info(f"  Total records: {records}")
+        logger.info(f"  Participants: {summary['participants']}")
+        logger.info(f"  Marches: {summary['marches']}")
+
+        if records and 'step_records' in summary:
+            logger.info(f"  Step data completeness: {summary['step_records'] / records * 100:.1f}%")
+
+        if records and 'hr_records' in summary:
+            logger.info(f"  Heart rate completeness: {summary['hr_records'] / records * 100:.1f}%")
+
+        return records
+
+    def _write_table(self, df: pd.DataFrame, output_file: Path, output_format: str = 'csv') -> Path:
+        """
+        Write a DataFrame as CSV, or as zstd-compressed Parquet next to ``output_file``
+
+        CSV is always written by ``DataFrame.to_csv`` so its text format (timestamps
+        to the second, minimal quoting, ``1.0`` for integral floats) is unchanged.
+        """
+        if output_format == 'parquet' and not HAS_PYARROW:
+            raise ImportError("pyarrow is required for Parquet output")
+
+        if output_format == 'parquet':
+            output_file = output_file.with_suffix('.parquet')
+            pq.write_table(pa.Table.from_pandas(df, preserve_index=False), output_file, compression='zstd')
+        else:
+            df.to_csv(output_file, index=False)
+
+        return output_file
 
     def save_merged_data(self, df_merged: pd.DataFrame, output_dir: Path,
-                        output_filename: str = 'march_timeseries_data_merged.csv'):
+                        output_filename: str = 'march_timeseries_data_merged.csv',
+                        output_format: str = 'csv'):
         """
-        Save merged data to CSV
+        Save merged data to CSV (or Parquet)
 
         Parameters
         ----------
@@ -385,31 +574,37 @@ class MarchDataMerger:
             Output directory
         output_filename : str
             Output filename (default: march_timeseries_data_merged.csv)
+        output_format : str
+            'csv' or 'parquet'; Parquet output is zstd-compressed and uses the
+            filename with a .parquet suffix (default: csv)
         """
         output_dir = Path(output_dir)
         output_dir.mkdir(parents=True, exist_ok=True)
 
-        output_file = output_dir / output_filename
-        df_merged.to_csv(output_file, index=False)
+        output_file = self._write_table(df_merged, output_dir / output_filename, output_format)
         logger.info(f"Saved merged data to {output_file}")
 
-        # Print summary statistics
+        # Print summary statistics (counted directly on the column arrays)
+        records = len(df_merged)
         logger.info(f"Merged data summary:")
-        logger.info(f"  Total records: {len(df_merged)}")
+        logger.info(f"  Total records: {records}")
         logger.info(f"  Participants: {df_merged['user_id'].nunique()}")
         logger.info(f"  Marches: {df_merged['march_id'].nunique()}")
 
         # Check data completeness
-        if 'steps' in df_merged.columns:
-            step_completeness = (df_merged['steps'] > 0).sum() / len(df_merged) * 100
+        if records and 'steps' in df_merged.columns:
+            steps = df_merged['steps'].to_numpy(dtype='float64', na_value=np.nan)
+            step_completeness = np.count_nonzero(steps > 0) / records * 100
             logger.info(f"  Step data completeness: {step_completeness:.1f}%")
 
-        if 'heart_rate' in df_merged.columns:
-            hr_completeness = df_merged['heart_rate'].notna().sum() / len(df_merged) * 100
+        if records and 'heart_rate' in df_merged.columns:
+            heart_rate = df_merged['heart_rate'].to_numpy(dtype='float64', na_value=np.nan)
+            hr_completeness = np.count_nonzero(~np.isnan(heart_rate)) / records * 100
             logger.info(f"  Heart rate completeness: {hr_completeness:.1f}%")
 
     def merge_summary_files(self, output_dir: Path,
-                           output_filename: str = 'march_health_metrics_merged.csv'):
+                           output_filename: str = 'march_health_metrics_merged.csv',
+                           output_format: str = 'csv'):
         """
         Merge step summary data INTO health metrics for upload
 
@@ -421,6 +616,8 @@ class MarchDataMerger:
             Output directory
         output_filename : str
             Output filename (default: march_health_metrics_merged.csv)
+        output_format : str
+            'csv' or 'parquet' (default: csv)
         """
         if not self.watch_summary_file:
             logger.warning("No watch summary file provided - cannot merge")
@@ -429,9 +626,12 @@ class MarchDataMerger:
         try:
             # Load health metrics (base file)
             logger.info(f"Loading health metrics from {self.watch_summary_file}")
-            df_health_metrics = pd.read_csv(self.watch_summary_file)
+            df_health_metrics = read_timeseries_csv(self.watch_summary_file)
             logger.info(f"Loaded {len(df_health_metrics)} health metrics records")
 
+            # Only summary rows for participants in the health metrics can match the LEFT JOINs
+            health_keys = pd.MultiIndex.from_frame(df_health_metrics[['march_id', 'user_id']])
+
             # If no step summary file, just use health metrics as-is
             if not self.step_summary_file:
                 logger.info("No step summary file - using health metrics only")
@@ -439,8 +639,19 @@ class MarchDataMerger:
             else:
                 # Load step summary
                 logger.info(f"Loading step summary from {self.step_summary_file}")
-                df_step_summary = pd.read_csv(self.step_summary_file)
+                df_step_summary = read_timeseries_csv(
+                    self.step_summary_file, columns=STEP_SUMMARY_COLUMNS
+                )
                 logger.info(f"Loaded {len(df_step_summary)} step summary records")
+                df_step_summary = df_step_summary[
+                    pd.MultiIndex.from_frame(df_step_summary[['march_id', 'user_id']]).isin(health_keys)
+                ]
+
+                # The merge allows at most one step summary row per participant; keep the last
+                duplicated = df_step_summary.duplicated(['march_id', 'user_id'], keep='last')
+                if duplicated.any():
+                    logger.warning(f"Dropping {duplicated.sum()} duplicate step summary rows (keeping the last per participant)")
+                    df_step_summary = df_step_summary[~duplicated]
 
                 # Select step columns to add (exclude join keys march_id, user_id)
                 step_columns_to_add = ['march_id', 'user_id']  # Join keys
@@ -450,42 +661,55 @@ class MarchDataMerger:
                     if col in df_step_summary.columns:
                         step_columns_to_add.append(col)
 
-                df_step_subset = df_step_summary[step_columns_to_add].copy()
+                # The step summary total gets its own name so it can take precedence over
+                # the watch-based total without _x/_y suffixes
+                df_step_subset = df_step_summary[step_columns_to_add].rename(
+                    columns={'total_steps': 'total_steps_acc'}
+                )
 
                 # LEFT JOIN: Keep all health metrics, add step data where available
                 df_merged = pd.merge(
                     df_health_metrics,
                     df_step_subset,
                     on=['march_id', 'user_id'],
-                    how='left'  # Preserve all health metrics records
+                    how='left',  # Preserve all health metrics records
+                    validate='m:1'  # At most one step summary row per participant
                 )
 
-                # Since there is 2 total steps columns, we get the new one as total_steps_y
-                if 'total_steps_y' in df_merged.columns:
-                    # Rename to total_steps for clarity
-                    df_merged = df_merged.rename(columns={'total_steps_y': 'total_steps'})
+                if 'total_steps_acc' in df_merged.columns:
+                    steps_acc = df_merged['total_steps_acc']
 
-                    # Drop old total_steps_x if exists
-                    if 'total_steps_x' in df_merged.columns:
-                        df_merged = df_merged.drop(columns=['total_steps_x'])
+                    # Log merge statistics
+                    step_data_count = steps_acc.notna().sum()
+                    logger.info(f"Merged step data: {step_data_count}/{len(df_merged)} participants have step data")
 
-                # Log merge statistics
-                step_data_count = df_merged['total_steps'].notna().sum()
-                logger.info(f"Merged step data: {step_data_count}/{len(df_merged)} participants have step data")
+                    # If health metrics already has total_steps, prefer step summary data
+                    # (step summary uses accelerometer, more accurate)
+                    if 'total_steps' in df_merged.columns:
+                        # Count replacements
+                        watch_steps = df_merged['total_steps'].to_numpy(dtype='float64', na_value=np.nan)
+                        acc_steps = steps_acc.to_numpy(dtype='float64', na_value=np.nan)
+                        replaced_count = np.count_nonzero(~np.isnan(watch_steps) & ~np.isnan(acc_steps))
+                        if replaced_count > 0:
+                            logger.info(f"  Replaced {replaced_count} watch-based step counts with accelerometer data")
 
-                # If health metrics already has total_steps, prefer step summary data
-                # (step summary uses accelerometer, more accurate)
-                if 'total_steps' in df_health_metrics.columns and 'total_steps' in df_step_subset.columns:
-                    # Count replacements
-                    replaced_count = (df_health_metrics['total_steps'].notna() & df_merged['total_steps'].notna()).sum()
-                    if replaced_count > 0:
-                        logger.info(f"  Replaced {replaced_count} watch-based step counts with accelerometer data")
+                        # Keep the watch-based count where there is no step summary
+                        df_merged['total_steps'] = steps_acc.combine_first(df_merged['total_steps'])
+                    else:
+                        df_merged['total_steps'] = steps_acc
+
+                    df_merged = df_merged.drop(columns=['total_steps_acc'])
 
             # Merge temp summary if available
             if self.temp_summary_file:
                 logger.info(f"Loading temp summary from {self.temp_summary_file}")
-                df_temp_summary = pd.read_csv(self.temp_summary_file)
+                df_temp_summary = read_timeseries_csv(
+                    self.temp_summary_file, columns=TEMP_SUMMARY_COLUMNS
+                )
                 logger.info(f"Loaded {len(df_temp_summary)} temp summary records")
+                df_temp_summary = df_temp_summary[
+                    pd.MultiIndex.from_frame(df_temp_summary[['march_id', 'user_id']]).isin(health_keys)
+                ]
 
                 temp_columns_to_add = ['march_id', 'user_id']
                 for col in ['avg_core_temp', 'min_core_temp', 'max_core_temp', 'temp_readings_count']:
@@ -515,8 +739,7 @@ class MarchDataMerger:
             output_dir = Path(output_dir)
             output_dir.mkdir(parents=True, exist_ok=True)
 
-            output_file = output_dir / output_filename
-            df_merged.to_csv(output_file, index=False)
+            output_file = self._write_table(df_merged, output_dir / output_filename, output_format)
             logger.info(f"Saved merged health metrics to {output_file}")
 
             # Print summary statistics
@@ -613,6 +836,20 @@ Examples:
         help='Output filename (default: march_timeseries_data_merged.csv)'
     )
 
+    parser.add_argument(
+        '--output-format',
+        choices=['csv', 'parquet'],
+        default='csv',
+        help='Output file format; parquet is zstd-compressed and replaces the .csv suffix (default: csv)'
+    )
+
+    parser.add_argument(
+        '--engine',
+        choices=['pandas', 'polars'],
+        default='pandas',
+        help='Library used to load, merge and save the timeseries data (default: pandas)'
+    )
+
     args = parser.parse_args()
 
     try:
@@ -627,23 +864,29 @@ Examples:
             temp_summary_file=args.temp_summary
         )
 
-        # Load data
-        df_watch, df_steps = merger.load_data()
+        if args.engine == 'polars':
+            # Load, merge and save timeseries data in one lazy query
+            if merger.merge_polars(args.output, args.output_filename, args.output_format) == 0:
+                logger.error("Merge resulted in empty dataset")
+                sys.exit(1)
+        else:
+            # Load data
+            df_watch, df_steps = merger.load_data()
 
-        # Merge timeseries data
-        df_merged = merger.merge_data(df_watch, df_steps)
+            # Merge timeseries data
+            df_merged = merger.merge_data(df_watch, df_steps)
 
-        if df_merged.empty:
-            logger.error("Merge resulted in empty dataset")
-            sys.exit(1)
+            if df_merged.empty:
+                logger.error("Merge resulted in empty dataset")
+                sys.exit(1)
 
-        # Save merged timeseries data
-        merger.save_merged_data(df_merged, args.output, args.output_filename)
+            # Save merged timeseries data
+            merger.save_merged_data(df_merged, args.output, args.output_filename, args.output_format)
 
         # Merge summary files if provided
         if args.watch_summary or args.step_summary or args.temp_summary:
             logger.info("\nMerging summary files...")
-            merger.merge_summary_files(args.output)
+            merger.merge_summary_files(args.output, output_format=args.output_format)
 
         logger.info("\nMerge complete!")
 
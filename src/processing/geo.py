@@ -0,0 +1,119 @@
+"""Vectorized geodesic helpers for GPS tracks.
+
+All functions take latitude/longitude in decimal degrees and operate on whole
+NumPy arrays so callers never loop over points in Python. When numba is
+installed, the per-step distance/bearing computation runs as a fused, parallel
+JIT kernel; otherwise it falls back to NumPy ufuncs.
+"""
+
+import math
+
+import numpy as np
+
+try:
+    from numba import njit, prange
+
+    HAS_NUMBA = True
+except ImportError:
+    HAS_NUMBA = False
+
+EARTH_RADIUS_KM = 6371.0
+
+# fastmath without the no-NaN/no-Inf assumptions, since NaN marks missing output
+_FASTMATH = {"nsz", "arcp", "contract", "afn", "reassoc"}
+
+
+def haversine_km(lat1, lon1, lat2, lon2) -> np.ndarray:
+    """Great-circle distance in km between paired coordinates (scalars or arrays)."""
+    lat1, lon1, lat2, lon2 = (
+        np.radians(np.asarray(x, dtype=np.float64)) for x in (lat1, lon1, lat2, lon2)
+    )
+    dlat = lat2 - lat1
+    dlon = lon2 - lon1
+    a = np.sin(dlat / 2) ** 2 + np.cos(lat1) * np.cos(lat2) * np.sin(dlon / 2) ** 2
+    return EARTH_RADIUS_KM * 2 * np.arctan2(np.sqrt(a), np.sqrt(1 - a))
+
+
+if HAS_NUMBA:
+
+    @njit(parallel=True, fastmath=_FASTMATH, cache=True)
+    def _step_geometry_kernel(lat, lon, cos_lat0, out_distance, out_bearing, out_turn):
+        """Fill distance/bearing/turning angle from radian lat/lon in one pass."""
+        for i in prange(1, lat.shape[0]):
+            lat1 = lat[i - 1]
+            lat2 = lat[i]
+            dlat = lat2 - lat1
+            dlon = lon[i] - lon[i - 1]
+            cos_lat1 = math.cos(lat1)
+            cos_lat2 = math.cos(lat2)
+
+            sin_half_dlat = math.sin(dlat / 2)
+            sin_half_dlon = math.sin(dlon / 2)
+            a = sin_half_dlat * sin_half_dlat + cos_lat1 * cos_lat2 * sin_half_dlon * sin_half_dlon
+            out_distance[i] = EARTH_RADIUS_KM * 2 * math.atan2(math.sqrt(a), math.sqrt(1 - a))
+
+            if dlat == 0 and dlon == 0:
+                continue
+            y = math.sin(dlon) * cos_lat2
+            x = cos_lat1 * math.sin(lat2) - math.sin(lat1) * cos_lat2 * math.cos(dlon)
+            out_bearing[i] = math.degrees(math.atan2(y, x)) % 360
+
+            if i < 2:
+                continue
+            # Previous movement vector in local equirectangular coordinates
+            dx_prev = (lon[i - 1] - lon[i - 2]) * cos_lat0
+            dy_prev = lat1 - lat[i - 2]
+            if dx_prev == 0 and dy_prev == 0:
+                continue
+            dx = dlon * cos_lat0
+            out_turn[i] = math.atan2(dx_prev * dlat - dy_prev * dx, dx_prev * dx + dy_prev * dlat)
+
+
+def step_geometry(lat, lon) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Per-point step distance, bearing and turning angle along a GPS track.
+
+    Returns, for each point relative to its predecessor:
+        distance (km), initial bearing (degrees, 0-360), and the signed turning
+        angle (radians, float32) between the previous and current movement.
+
+    The first point has NaN distance and bearing, the first two points have a
+    NaN turning angle, and stationary steps leave bearing/turning angle NaN.
+    """
+    lat = np.ascontiguousarray(np.radians(np.asarray(lat, dtype=np.float64)))
+    lon = np.ascontiguousarray(np.radians(np.asarray(lon, dtype=np.float64)))
+
+    distance = np.full(lat.shape, np.nan)
+    bearing = np.full(lat.shape, np.nan)
+    turn = np.full(lat.shape, np.nan)
+    if lat.size < 2:
+        return distance, bearing, turn.astype(np.float32)
+
+    # Equirectangular projection around the track's mean latitude
+    cos_lat0 = np.cos(np.nanmean(lat))
+
+    if HAS_NUMBA:
+        _step_geometry_kernel(lat, lon, cos_lat0, distance, bearing, turn)
+        return distance, bearing, turn.astype(np.float32)
+
+    lat1, lat2 = lat[:-1], lat[1:]
+    dlat = np.diff(lat)
+    dlon = np.diff(lon)
+    cos_lat1 = np.cos(lat1)
+    cos_lat2 = np.cos(lat2)
+
+    a = np.sin(dlat / 2) ** 2 + cos_lat1 * cos_lat2 * np.sin(dlon / 2) ** 2
+    distance[1:] = EARTH_RADIUS_KM * 2 * np.arctan2(np.sqrt(a), np.sqrt(1 - a))
+
+    stationary = (dlat == 0) & (dlon == 0)
+    y = np.sin(dlon) * cos_lat2
+    x = cos_lat1 * np.sin(lat2) - np.sin(lat1) * cos_lat2 * np.cos(dlon)
+    bearing[1:] = np.degrees(np.arctan2(y, x)) % 360
+    bearing[1:][stationary] = np.nan
+
+    dx = dlon * cos_lat0
+    cross = dx[:-1] * dlat[1:] - dlat[:-1] * dx[1:]
+    dot = dx[:-1] * dx[1:] + dlat[:-1] * dlat[1:]
+    turn[2:] = np.arctan2(cross, dot)
+    turn[2:][stationary[:-1] | stationary[1:]] = np.nan
+
+    return distance, bearing, turn.astype(np.float32)
@@ -4,12 +4,16 @@ Each parser extracts all available time-series fields into a pandas DataFrame
 with a 'timestamp' column as the common join key.
 """
 
+import csv
 import logging
 import re
 import xml.etree.ElementTree as ET
+from collections import defaultdict
+from collections.abc import Collection
 from pathlib import Path
 from zoneinfo import ZoneInfo
 
+import numpy as np
 import pandas as pd
 
 try:
@@ -27,6 +31,13 @@ try:
 except ImportError:
     HAS_FIT = False
 
+try:
+    from pyarrow import csv as pacsv
+
+    HAS_PYARROW = True
+except ImportError:
+    HAS_PYARROW = False
+
 logger = logging.getLogger(__name__)
 
 TIMEZONE = ZoneInfo("Europe/Zurich")
@@ -69,24 +80,38 @@ def parse_gpx(gpx_file: Path) -> pd.DataFrame:
         logger.error(f"Error parsing GPX file {gpx_file}: {e}")
         return pd.DataFrame()
 
-    points: list[dict] = []
+    # Core fields are collected column-wise; sparse extension fields per point
+    ts_list: list = []
+    lat_list: list[float] = []
+    lon_list: list[float] = []
+    ele_list: list[float | None] = []
+    ext_rows: list[dict] = []
     for track in gpx.tracks:
         for segment in track.segments:
             for point in segment.points:
-                row: dict = {
-                    "timestamp": _to_local_naive(point.time),
-                    "latitude": point.latitude,
-                    "longitude": point.longitude,
-                    "altitude": point.elevation,
-                }
-                _extract_gpx_extensions(point, row)
-                points.append(row)
-
-    if not points:
+                ts_list.append(_to_local_naive(point.time))
+                lat_list.append(point.latitude)
+                lon_list.append(point.longitude)
+                ele_list.append(point.elevation)
+                ext: dict = {}
+                _extract_gpx_extensions(point, ext)
+                ext_rows.append(ext)
+
+    if not ts_list:
         logger.warning(f"No track points found in {gpx_file.name}")
         return pd.DataFrame()
 
-    df = pd.DataFrame(points)
+    df = pd.DataFrame(
+        {
+            "timestamp": ts_list,
+            "latitude": np.asarray(lat_list, dtype=np.float64),
+            "longitude": np.asarray(lon_list, dtype=np.float64),
+            "altitude": np.asarray(ele_list, dtype=np.float32),
+        }
+    )
+    if any(ext_rows):
+        ext_df = pd.DataFrame(ext_rows)
+        df = df.join(ext_df[[col for col in ext_df.columns if col not in df.columns]])
     logger.info(f"Parsed {len(df)} GPS points with {len(df.columns)} columns from {gpx_file.name}")
     return df
 
@@ -344,6 +369,85 @@ def parse_fit(fit_file: Path) -> pd.DataFrame:
         return pd.DataFrame()
 
 
+# ---------------------------------------------------------------------------
+# CSV – processed time-series
+# ---------------------------------------------------------------------------
+
+# Read long CSVs in multi-megabyte blocks rather than pyarrow's 1 MB default
+_CSV_BLOCK_SIZE = 8 * 1024 * 1024
+
+
+def read_timeseries_csv(
+    csv_file: Path, columns: Collection[str] | None = None
+) -> pd.DataFrame:
+    """Read a processed time-series CSV (one row per sample) into a DataFrame.
+
+    Uses pyarrow's multithreaded CSV reader when available and falls back to
+    ``pd.read_csv`` otherwise. If ``columns`` is given, only those columns are
+    parsed (in file order); names missing from the file are ignored.
+    """
+    if not HAS_PYARROW:
+        usecols = None if columns is None else (lambda col: col in columns)
+        return pd.read_csv(csv_file, usecols=usecols)
+
+    include_columns = None
+    if columns is not None:
+        with open(csv_file, newline="") as f:
+            header = next(csv.reader(f), [])
+        include_columns = [col for col in header if col in columns]
+
+    table = pacsv.read_csv(
+        str(csv_file),
+        read_options=pacsv.ReadOptions(block_size=_CSV_BLOCK_SIZE),
+        convert_options=pacsv.ConvertOptions(
+            strings_can_be_null=True, include_columns=include_columns
+        ),
+    )
+    return table.to_pandas(self_destruct=True)
+
+
+def csv_datetime_digits(time_of_day_ns: np.ndarray) -> int | None:
+    """Return the fractional-second digits ``DataFrame.to_csv`` writes a datetime column with.
+
+    ``time_of_day_ns`` holds the nanoseconds since midnight of the column's
+    values. Like pandas, this is None (only dates are written) when every value
+    is at midnight, and 3, 6 or 9 as soon as one value needs them.
+    """
+    time_of_day_ns = np.asarray(time_of_day_ns, dtype=np.int64)
+    if not time_of_day_ns.any():
+        return None
+    subsecond_ns = time_of_day_ns % 1_000_000_000
+    for digits in (0, 3, 6):
+        if not (subsecond_ns % 10 ** (9 - digits)).any():
+            return digits
+    return 9
+
+
+def csv_datetime_format(time_of_day_ns: np.ndarray) -> str:
+    """Return the Polars ``datetime_format`` that writes datetimes like ``DataFrame.to_csv``."""
+    digits = csv_datetime_digits(time_of_day_ns)
+    if digits is None:
+        return "%Y-%m-%d"
+    if digits == 0:
+        return "%Y-%m-%d %H:%M:%S"
+    return f"%Y-%m-%d %H:%M:%S%.{digits}f"
+
+
+def format_csv_datetimes(values: pd.Series, digits: int | None) -> pd.Series:
+    """Format datetimes as ``DataFrame.to_csv`` does in a column needing ``digits`` digits.
+
+    Missing values stay missing, so ``to_csv`` still writes them as empty fields.
+    """
+    if digits is None:
+        return values.dt.strftime("%Y-%m-%d")
+    text = values.dt.strftime("%Y-%m-%d %H:%M:%S")
+    if digits:
+        fraction_ns = (values - values.dt.floor("s")).to_numpy(dtype="int64", na_value=0)
+        fraction = pd.Series(fraction_ns // 10 ** (9 - digits), index=values.index)
+        text = text + "." + fraction.astype(str).str.zfill(digits)
+    return text
+
+
 # ---------------------------------------------------------------------------
 # File discovery
 # ---------------------------------------------------------------------------
@@ -374,7 +478,9 @@ def find_participant_files(
         ext = f.suffix.lower().lstrip(".")
         stems.setdefault(stem, {})[ext] = f
 
-    participants: dict[str, list[dict]] = {}
+    # (activity_num, file_id, entry) tuples sort natively; file_id is unique
+    # per stem, so ties on activity_num never fall through to comparing dicts
+    grouped: defaultdict[str, list[tuple[int, str, dict]]] = defaultdict(list)
     for stem, files_by_ext in stems.items():
         match = re.match(r"^([A-Za-z0-9]+?)(?:_(\d+))?$", stem)
         if match:
@@ -389,10 +495,11 @@ def find_participant_files(
             "file_id": stem,
             **files_by_ext,
         }
-        participants.setdefault(pid, []).append(entry)
+        grouped[pid].append((activity_num, stem, entry))
 
-    for pid in participants:
-        participants[pid].sort(key=lambda x: x["activity_num"])
+    participants: dict[str, list[dict]] = {
+        pid: [entry for _, _, entry in sorted(acts)] for pid, acts in grouped.items()
+    }
 
     total = sum(len(acts) for acts in participants.values())
     logger.info(f"Found {len(participants)} participants with {total} total activities")
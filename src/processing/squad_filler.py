@@ -30,6 +30,8 @@ from zoneinfo import ZoneInfo
 import numpy as np
 import pandas as pd
 
+from src.processing.parsers import read_timeseries_csv
+
 logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
 logger = logging.getLogger(__name__)
 
@@ -273,7 +275,7 @@ def fill_non_watch(
     with open(crossings_path, "r") as f:
         crossing_times = json.load(f)
 
-    df_timeseries = pd.read_csv(timeseries_path)
+    df_timeseries = read_timeseries_csv(timeseries_path)
     df_timeseries["timestamp"] = pd.to_datetime(df_timeseries["timestamp"])
     df_gps = pd.read_csv(gps_path)
     df_health = pd.read_csv(health_path)
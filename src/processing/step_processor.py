@@ -1,265 +1,22 @@
 import json
+from functools import lru_cache
+
 import numpy as np
 import pandas as pd
-from scipy.signal import find_peaks, sosfiltfilt, butter
-from typing import Union, Any
-
-
-def _validate_filter_params(signal: Union[np.ndarray, list], cutoff: float, fs: float, order: int, filter_type: str):
-    """Validate common filter parameters."""
-    # Convert to numpy array if needed
-    signal = np.asarray(signal)
-
-    # Check signal length
-    if len(signal) < 2:
-        raise ValueError(f"Signal too short for filtering: {len(signal)} samples. Minimum 2 samples required.")
-
-    # For very short signals, check scipy limitations
-    # sosfiltfilt requires signal length > 3 * ntaps, where ntaps = 2 * order
-    min_samples_required = 6 * order + 1  # scipy requirement
-    min_samples_recommended = 3 * order  # Quality recommendation
-
-    if len(signal) <= min_samples_required:
-        raise ValueError(f"Signal too short for order-{order} filter: {len(signal)} samples. "
-                        f"Minimum required: {min_samples_required + 1} samples. "
-                        f"Consider using a lower filter order or longer signal.")
-
-    if len(signal) < min_samples_recommended * 3:  # More conservative warning
-        print(f"Signal length ({len(signal)}) is shorter than recommended minimum "
-                      f"({min_samples_recommended * 3}) for order-{order} filter. Results may contain artifacts.")
-
-    # Validate sampling frequency
-    if fs <= 0:
-        raise ValueError(f"Sampling frequency must be positive, got {fs}")
-
-    # Validate filter order
-    if order < 1:
-        raise ValueError(f"Filter order must be >= 1, got {order}")
-
-    # Check Nyquist frequency constraints
-    nyquist = 0.5 * fs
-
-    if cutoff <= 0:
-        raise ValueError(f"Cutoff frequency must be positive, got {cutoff}")
-
-    if cutoff >= nyquist:
-        raise ValueError(f"Cutoff frequency ({cutoff} Hz) must be less than Nyquist frequency "
-                        f"({nyquist} Hz) for sampling rate {fs} Hz")
-
-    # Additional check for frequencies very close to Nyquist (can cause numerical issues)
-    if cutoff > 0.95 * nyquist:
-        raise ValueError(f"Cutoff frequency ({cutoff} Hz) is too close to Nyquist frequency "
-                        f"({nyquist} Hz). Maximum recommended: {0.95 * nyquist:.2f} Hz")
-
-    return np.asarray(signal)
-
-def _validate_bandpass_params(signal: Union[np.ndarray, list], lowcut: float, highcut: float, fs: float, order: int):
-    """Validate bandpass filter parameters."""
-    # First validate common parameters (using lowcut as cutoff)
-    signal = _validate_filter_params(signal, lowcut, fs, order, "bandpass")
-
-    # Additional bandpass-specific validations
-    if highcut <= 0:
-        raise ValueError(f"High cutoff frequency must be positive, got {highcut}")
-
-    if lowcut >= highcut:
-        raise ValueError(f"Low cutoff frequency ({lowcut}) must be less than high cutoff frequency ({highcut})")
-
-    nyquist = 0.5 * fs
-    if highcut >= nyquist:
-        raise ValueError(f"High cutoff frequency ({highcut} Hz) must be less than Nyquist frequency "
-                        f"({nyquist} Hz) for sampling rate {fs} Hz")
-
-    if highcut > 0.95 * nyquist:
-        raise ValueError(f"High cutoff frequency ({highcut} Hz) is too close to Nyquist frequency "
-                        f"({nyquist} Hz). Maximum recommended: {0.95 * nyquist:.2f} Hz")
-
-    return signal
-
-def highpass_filter(
-    s: Union[np.ndarray, list], lowcut: float, fs: float, order: int = 5
-) -> np.ndarray:
-    """
-    Apply a Butterworth highpass filter to the signal.
-
-    ### Args:
-    - signal (np.ndarray): Array-like, the signal to be filtered.
-    - lowcut (float): The low cutoff frequency of the filter.
-    - fs (float): Sampling frequency of the signal
-    - order (int): Order of the filter
-
-    ### Returns:
-    Array-like, the filtered signal.
-
-    ### Raises:
-    - ValueError: If parameters are invalid or signal is too short
-
-    ### Example:
-
-      >>> import numpy as np
-      >>> data = np.random.randn(100)
-      >>> lc = 0.4
-      >>> fs = 50.0
-      >>> filtered_data = highpass_filter(data, lc, fs, order=5)
-
-    """
-    # Validate parameters and convert signal
-    signal = _validate_filter_params(s, lowcut, fs, order, "highpass")
-
-    try:
-        nyq = 0.5 * fs
-        low = lowcut / nyq
-        sos = butter(order, low, btype="highpass", output="sos")
-        y = sosfiltfilt(sos, signal)
-        return y
-    except Exception as e:
-        print(f"Error in highpass filter: {str(e)}")
-        raise RuntimeError(f"Filter operation failed: {str(e)}") from e
-
-
-def lowpass_filter(
-    s: Union[np.ndarray, list], highcut: float, fs: float, order: int = 5
-) -> np.ndarray:
-    """
-    Apply a Butterworth lowpass filter to the signal.
-
-    ### Args:
-    - signal (np.ndarray): Array-like, the signal to be filtered.
-    - highcut (float): The high cutoff frequency of the filter.
-    - fs (float): Sampling frequency of the signal
-    - order (int): Order of the filter
-
-    ### Returns:
-    Array-like, the filtered signal.
-
-    ### Raises:
-    - ValueError: If parameters are invalid or signal is too short
-
-    ### Example:
-
-      >>> import numpy as np
-      >>> data = np.random.randn(100)
-      >>> hc = 10.5
-      >>> fs = 50.0
-      >>> filtered_data = lowpass_filter(data, hc, fs, order=5)
-
-    """
-    # Validate parameters and convert signal
-    signal = _validate_filter_params(s, highcut, fs, order, "lowpass")
-
-    try:
-        nyq = 0.5 * fs
-        high = highcut / nyq
-        sos = butter(order, high, btype="lowpass", output="sos")
-        y = sosfiltfilt(sos, signal)
-        return y
-    except Exception as e:
-        print(f"Error in lowpass filter: {str(e)}")
-        raise RuntimeError(f"Filter operation failed: {str(e)}") from e
-
-
-def bandpass_filter(
-    s: Union[np.ndarray, list], lowcut: float, highcut: float, fs: float, order: int = 5
-) -> np.ndarray:
-    """
-    Apply a Butterworth bandpass filter to the signal.
-
-    ### Args:
-    - signal (np.ndarray): Array-like, the signal to be filtered.
-    - lowcut (float): The low cutoff frequency of the filter.
-    - highcut (float): The high cutoff frequency of the filter.
-    - fs (float): Sampling frequency of the signal
-    - order (int): Order of the filter
-
-    ### Returns:
-    Array-like, the filtered signal.
-
-    ### Raises:
-    - ValueError: If parameters are invalid or signal is too short
-
-    ### Example:
-
-      >>> import numpy as np
-      >>> data = np.random.randn(100)
-      >>> lc = 2.0
-      >>> hc = 10.5
-      >>> fs = 50.0
-      >>> filtered_data = bandpass_filter(data, lc, hc, fs, order=5)
-
-    """
-    # Validate parameters and convert signal
-    signal = _validate_bandpass_params(s, lowcut, highcut, fs, order)
-
-    try:
-        nyq = 0.5 * fs
-        low = lowcut / nyq
-        high = highcut / nyq
-        sos = butter(order, [low, high], btype="bandpass", output="sos")
-        y = sosfiltfilt(sos, signal)
-        return y
-    except Exception as e:
-        print(f"Error in bandpass filter: {str(e)}")
-        raise RuntimeError(f"Filter operation failed: {str(e)}") from e
-
-
-def acceleration_filter(
-    acc: pd.DataFrame, fs: float, lowcut: float = 10.0
-) -> pd.DataFrame:
-    """
-    Apply a Butterworth highpass filter to the acceleration signals.
-
-    ### Args:
-    - acc (pd.DataFrame): DataFrame, the acceleration signals.
-    - fs (int): Sampling frequency of the signal
-    - lowcut (float): The low cutoff frequency of th filter.
-
-    ### Returns:
-    DataFrame, the filtered acceleration signals.
-
-    ### Example:
-
-      >>> import pandas as pd
-      >>> data = pd.DataFrame({"x": np.random(100), "y": np.random(100), "z": np.random(100)})
-      >>> fs = 50.0
-      >>> filtered_data = acceleration_filter(data, fs, lowcut=10.0)
-
-    """
-    acc["Xf"] = highpass_filter(acc["X"].values, lowcut, fs)
-    acc["Yf"] = highpass_filter(acc["Y"].values, lowcut, fs)
-    acc["Zf"] = highpass_filter(acc["Z"].values, lowcut, fs)
-
-    return acc
-
-
-def ppg_filter(
-    ppg: pd.DataFrame, fs: float, lowcut: float = 0.3, highcut: float = 4.0
-) -> pd.DataFrame:
-    """
-    Apply a Butterworth bandpass filter to the PPG signals.
-
-    ### Args:
-    - ppg (pd.DataFrame): DataFrame, the PPG signals.
-    - fs (int): Sampling frequency of the signal
-    - lowcut (float): The low cutoff frequency of th filter.
-    - highcut (float): The high cutoff frequency of th filter.
-
-    ### Returns:
-    DataFrame, the filtered PPG signals.
-
-    ### Example:
-
-      >>> import pandas as pd
-      >>> data = pd.DataFrame({"P0": np.random(100), "P1": np.random(100), "P2": np.random(100)})
-      >>> fs = 50.0
-      >>> filtered_data = ppg_filter(data, fs, lowcut=0.3, highcut=4.0)
-
-    """
-    ppg["P0f"] = bandpass_filter(ppg["P0"].values, lowcut, highcut, fs)
-    ppg["P1f"] = bandpass_filter(ppg["P1"].values, lowcut, highcut, fs)
-    ppg["P2f"] = bandpass_filter(ppg["P2"].values, lowcut, highcut, fs)
-
-    return ppg
-
+from scipy.fft import rfft, rfftfreq
+from scipy.signal import find_peaks
+
+# Filters are shared with src.processing.filters, which caches the Butterworth
+# designs and runs multi-channel signals through a single 2-D pass
+from src.processing.filters import (  # noqa: F401
+    acceleration_filter,
+    bandpass_filter,
+    highpass_filter,
+    lowpass_filter,
+    ppg_filter,
+    segment_argmin,
+)
+from src.processing.filters import find_peaks_and_minimas_np as _find_minima_and_peaks
 
 
 def find_peaks_and_minimas_np(mag: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
@@ -281,38 +38,17 @@ def find_peaks_and_minimas_np(mag: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
         Indices of the peaks in the magnitude data.
     """
 
-    # Get the minimum points for range of 5
-    argmins = [np.argmin(mag[i : i + 5]) + i for i in range(0, mag.shape[0] - 10, 5)]
-    argmins_mag = [mag[i] for i in argmins]
-
-    # Find minima in the processed data
-    minima, _ = find_peaks(-np.array(argmins_mag).reshape(-1), height=100)
-
-    # Get indices and magnitudes of minima
-    minima_indices = np.array(argmins)[minima]
-    minima_magnitudes = np.array(argmins_mag)[minima]
-
-    # Find peaks between minima
-    peaks_indices = np.array(
-        [
-            np.argmax(mag[minima_indices[i] : minima_indices[i + 1]]) + minima_indices[i]
-            for i in range(len(minima_indices) - 1)
-        ]
-    )
-    peaks_magnitudes = np.array([mag[i] for i in peaks_indices])
+    # Minima of 5-sample blocks and the first peak between consecutive minima
+    minima_indices, peaks_indices = _find_minima_and_peaks(mag)
+    peaks_magnitudes = mag[peaks_indices]
 
     # Only use peaks with magnitudes greater than 100
     peaks_indices = peaks_indices[peaks_magnitudes > 100]
     peaks_magnitudes = peaks_magnitudes[peaks_magnitudes > 100]
 
     # Find minima between peaks
-    minima_indices = np.array(
-        [
-            np.argmin(mag[peaks_indices[i] : peaks_indices[i + 1]]) + peaks_indices[i]
-            for i in range(len(peaks_indices) - 1)
-        ]
-    )
-    minima_magnitudes = np.array([mag[i] for i in minima_indices])
+    minima_indices = segment_argmin(mag, peaks_indices)
+    minima_magnitudes = mag[minima_indices]
 
     # Difference between peak and minima magnitudes
     diff_magnitudes = peaks_magnitudes[:-1] - minima_magnitudes
@@ -344,6 +80,14 @@ def find_peaks_and_minimas_np(mag: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
     return minima_indices, peaks_indices
 
 
+@lru_cache(maxsize=32)
+def _hamming(n: int) -> np.ndarray:
+    """Hamming window of length ``n``, cached (read-only) since every window has the same length."""
+    window = np.hamming(n)
+    window.setflags(write=False)
+    return window
+
+
 def _perform_fft(mag: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
     """
     Perform Fast Fourier Transform (FFT) on the magnitude data and filter the results.
@@ -351,7 +95,8 @@ def _perform_fft(mag: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
     Parameters
     ----------
     mag : np.ndarray
-        The magnitude data as a NumPy array.
+        The magnitude data as a NumPy array. A 2-D array is treated as a batch of
+        equal-length windows (one per row), transformed in a single call.
 
     Returns
     -------
@@ -362,33 +107,26 @@ def _perform_fft(mag: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
     """
 
     #  Apply hamming window
-    N = len(mag)
-    window = np.hamming(N)
-    windowed_mag = mag * window
+    N = mag.shape[-1]
+    windowed_mag = mag * _hamming(N)
 
-    # Fourier Transform
-    fft_windowed_mag = np.fft.fft(windowed_mag)
+    # Fourier Transform: the input is real, so rfft computes only the non-negative
+    # frequencies; keep the same N // 2 bins the full FFT was sliced to
+    fft_windowed_mag = rfft(windowed_mag, axis=-1, workers=-1)[..., : N // 2]
     T = 1 / 52
 
-    # Frequencies
-    frequencies = np.fft.fftfreq(N, T)
-    pos_frequencies = frequencies[: N // 2]
+    # Positive frequencies
+    pos_frequencies = rfftfreq(N, T)[: N // 2]
 
     # Filter my fft results:
     low_cutoff = 1.4
     high_cutoff = 10
 
     # Create filter mask
-    filter_mask = (np.abs(frequencies) >= low_cutoff) & (np.abs(frequencies) <= high_cutoff)
+    filter_mask = (pos_frequencies >= low_cutoff) & (pos_frequencies <= high_cutoff)
 
-    # Apply filter (only for windowed) part
-    filtered_fft_win_mag = fft_windowed_mag * filter_mask
-
-    # Magnitudes
-    fft_magnitudes = np.abs(filtered_fft_win_mag)
-
-    # Positive frequencies and magnitudes
-    pos_fft_magnitudes = fft_magnitudes[: N // 2]
+    # Apply filter and take the magnitudes of the positive frequencies
+    pos_fft_magnitudes = np.abs(fft_windowed_mag * filter_mask)
 
     return pos_fft_magnitudes, pos_frequencies
 
@@ -469,17 +207,44 @@ def fft_and_processing(df: pd.DataFrame, start: int, interval_seconds: int) -> f
         The calculated steps per second based on the FFT results. Returns 0 if the conditions are not met.
     """
 
-    # Get interval and window
-    interval = df.shape[0]
-
-    frequency = 52
-
     # Transform to np array
     mag = np.array(df["magnitude"])
 
     # Perform fft and return positive magnitudes and frequencies
     pos_fft_magnitudes, pos_frequencies = _perform_fft(mag)
 
+    return _steps_from_spectrum(mag, pos_fft_magnitudes, pos_frequencies, interval_seconds)
+
+
+def _steps_from_spectrum(
+    mag: np.ndarray, pos_fft_magnitudes: np.ndarray, pos_frequencies: np.ndarray,
+    interval_seconds: int
+) -> float:
+    """
+    Steps per second of one window given its filtered spectrum (see ``fft_and_processing``).
+
+    Parameters
+    ----------
+    mag : np.ndarray
+        The magnitude data of the window.
+    pos_fft_magnitudes : np.ndarray
+        The window's positive-frequency magnitudes from ``_perform_fft``.
+    pos_frequencies : np.ndarray
+        The positive frequencies corresponding to the magnitudes.
+    interval_seconds : int
+        The interval in seconds for which the FFT is calculated.
+
+    Returns
+    -------
+    float
+        The calculated steps per second. Returns 0 if the conditions are not met.
+    """
+
+    # Get interval and window
+    interval = mag.shape[0]
+
+    frequency = 52
+
     # Get steps per second, amplitudes and ptn_ratio from fft values
     sps_fft, amplitude_fft, ptn_ratio = _calculate_steps_amplitude_peaks_ptn(
         pos_fft_magnitudes, pos_frequencies, interval
@@ -506,6 +271,48 @@ def fft_and_processing(df: pd.DataFrame, start: int, interval_seconds: int) -> f
         return 0
 
 
+def _chunk_steps(
+    chunks: list[np.ndarray], interval_seconds: int, min_samples: int
+) -> tuple[list, list]:
+    """
+    Steps per second and middle sample index for each chunk of magnitude data.
+
+    Chunks of the same length are stacked and go through one batched FFT; chunks
+    shorter than ``min_samples`` get 0 for both.
+
+    Parameters
+    ----------
+    chunks : list[np.ndarray]
+        Magnitude data of each chunk.
+    interval_seconds : int
+        The interval in seconds covered by each chunk.
+    min_samples : int
+        Minimum number of samples for a chunk to be processed.
+
+    Returns
+    -------
+    tuple[list, list]
+        Steps per second and middle sample index, one entry per chunk.
+    """
+    sps_l = [0] * len(chunks)
+    sample_l = [0] * len(chunks)
+
+    lengths = np.array([len(chunk) for chunk in chunks], dtype=np.intp)
+    for length in np.unique(lengths[lengths >= min_samples]):
+        indices = np.flatnonzero(lengths == length)
+        pos_fft_magnitudes, pos_frequencies = _perform_fft(np.stack([chunks[i] for i in indices]))
+
+        for row, i in enumerate(indices):
+            sps_l[i] = _steps_from_spectrum(
+                chunks[i], pos_fft_magnitudes[row], pos_frequencies, interval_seconds
+            )
+            # Use the middle sample index of the chunk
+            # (for backward compatibility with existing code)
+            sample_l[i] = int(length) // 2
+
+    return sps_l, sample_l
+
+
 def get_magnitudes(df_input: pd.DataFrame) -> pd.DataFrame:
     """
     Calculate the magnitude of the accelerometer data and apply a high-pass filter.
@@ -521,13 +328,11 @@ def get_magnitudes(df_input: pd.DataFrame) -> pd.DataFrame:
         DataFrame with the calculated magnitudes and filtered values.
     """
 
-    df = df_input.copy()
-    time_series = None
+    # Only the axes and time are needed, so read them without copying the whole frame;
+    # to_numpy(dtype=float) makes the single float copy the magnitude is computed from
+    np_df = df_input[["X", "Y", "Z"]].to_numpy(dtype=float)
 
-    np_df = np.array(df[["X", "Y", "Z"]])
-    np_df = np_df.astype(float)
-
-    time_series = df["Time"]
+    time_series = df_input["Time"]
     mag = np.linalg.norm(np_df, axis=1)
 
     # High-pass filter the magnitude
@@ -578,39 +383,31 @@ def get_steps(df: pd.DataFrame, interval_size: int = 8) -> pd.DataFrame:
     if not pd.api.types.is_datetime64_any_dtype(df['time']):
         df['time'] = pd.to_datetime(df['time'])
 
-    # Set time as index for groupby
+    # Sort by time, dropping missing timestamps like the time grouping did
     df_indexed = df.set_index('time').sort_index()
+    df_indexed = df_indexed[df_indexed.index.notna()]
 
-    # Group by time intervals
-    grouped = df_indexed.groupby(pd.Grouper(freq=f'{interval_size}s'))
-
-    # lists for steps
-    sps_l = []
-    sample_l = []
+    # Chunk the data into the same bins pd.Grouper(freq=f'{interval_size}s') uses
+    # (closed on the left, anchored at midnight of the first day, empty bins kept),
+    # locating all chunk boundaries with one searchsorted instead of a groupby loop.
+    # Each chunk is labelled with its starting timestamp
     time_l = []
+    chunks = []
+    if not df_indexed.empty:
+        freq = pd.Timedelta(seconds=interval_size)
+        first, last = df_indexed.index[0], df_indexed.index[-1]
+        origin = first.normalize()
+        first = first - (first - origin) % freq
+        last = last + (freq - (last - origin) % freq)
 
-    # Process each time chunk
-    for timestamp, group in grouped:
-        # Use starting timestamp of the chunk
-        time_l.append(timestamp)
-
-        if group.shape[0] < min_samples:
-            sps_l.append(0)
-            sample_l.append(0)
-            continue
-
-        # Reset index to get integer-based indexing for fft_and_processing
-        group_reset = group.reset_index()
+        edges = pd.date_range(first, last, freq=freq)
+        offsets = df_indexed.index.searchsorted(edges, side='left')
+        magnitude = df_indexed["magnitude"].to_numpy()
 
-        # Use the first sample of the chunk (start = 0)
-        sps = fft_and_processing(group_reset, start=0, interval_seconds=interval_size)
+        time_l = list(edges[:-1])
+        chunks = [magnitude[start:end] for start, end in zip(offsets[:-1], offsets[1:], strict=True)]
 
-        # Use the middle sample index relative to original df
-        # (for backward compatibility with existing code)
-        mid_idx = len(group) // 2
-        sample_l.append(mid_idx)
-
-        sps_l.append(sps)
+    sps_l, sample_l = _chunk_steps(chunks, interval_size, min_samples)
 
     df_steps = pd.DataFrame(
         {
@@ -716,12 +513,11 @@ def get_step_count_and_distribution(df: pd.DataFrame, interval_size: int = 8) ->
 import argparse
 import logging
 import sys
-from pathlib import Path
 from datetime import datetime
+from pathlib import Path
 from typing import Optional
 from zoneinfo import ZoneInfo
 
-
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
@@ -18,6 +18,8 @@ import argparse
 import json
 import logging
 import sys
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Optional
@@ -26,13 +28,32 @@ from zoneinfo import ZoneInfo
 import numpy as np
 import pandas as pd
 
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    HAS_PYARROW = True
+except ImportError:
+    HAS_PYARROW = False
+
+try:
+    import polars as pl
+
+    HAS_POLARS = True
+except ImportError:
+    HAS_POLARS = False
+
+from src.processing.geo import haversine_km, step_geometry
 from src.processing.parsers import (
-    find_participant_files as _find_participant_files,
-)
-from src.processing.parsers import (
+    csv_datetime_digits,
+    csv_datetime_format,
+    format_csv_datetimes,
     parse_gpx,
     parse_tcx,
 )
+from src.processing.parsers import (
+    find_participant_files as _find_participant_files,
+)
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
@@ -40,6 +61,102 @@ logger = logging.getLogger(__name__)
 
 TIMEZONE = ZoneInfo("Europe/Zurich")
 
+# Heart rate zone boundaries (bpm) and the zone each interval maps to
+HR_ZONE_EDGES = np.array([100, 120, 140, 160], dtype=np.float32)
+HR_ZONE_NAMES = (
+    "very_light_percent",
+    "light_percent",
+    "moderate_percent",
+    "intense_percent",
+    "beast_mode_percent",
+)
+
+# Output column order for the timeseries and GPS files
+TIMESERIES_COLS = (
+    "march_id",
+    "user_id",
+    "timestamp",
+    "timestamp_minutes",
+    "heart_rate",
+    "steps",
+    "speed_kmh",
+    "cumulative_distance_km",
+)
+GPS_COLS = (
+    "march_id",
+    "user_id",
+    "timestamp_minutes",
+    "latitude",
+    "longitude",
+    "altitude",
+    "speed_kmh",
+)
+
+# Uniform dtypes for every streamed output frame, so participants with missing
+# or integer-valued measurements still share one file schema
+TIMESERIES_DTYPES = {
+    "march_id": "int64",
+    "user_id": "object",
+    "timestamp": "datetime64[ns]",
+    "timestamp_minutes": "float64",
+    "heart_rate": "float32",
+    "steps": "float64",
+    "speed_kmh": "float32",
+    "cumulative_distance_km": "float32",
+}
+GPS_DTYPES = {
+    "march_id": "int64",
+    "user_id": "object",
+    "timestamp_minutes": "float64",
+    "latitude": "float64",
+    "longitude": "float64",
+    "altitude": "float64",
+    "speed_kmh": "float32",
+}
+
+# Compact Parquet column types; integer columns match the database INTEGER
+# columns and are rounded (nullable, since resampled gaps are NaN)
+TIMESERIES_PARQUET_DTYPES = {
+    "march_id": "int32",
+    "timestamp_minutes": "Int32",
+    "heart_rate": "Int16",
+    "steps": "Int32",
+    "speed_kmh": "float32",
+    "cumulative_distance_km": "float32",
+}
+GPS_PARQUET_DTYPES = {
+    "march_id": "int32",
+    "timestamp_minutes": "float32",
+    "elevation": "float32",
+    "speed_kmh": "float32",
+    "bearing": "float32",
+}
+
+# Nanoseconds per minute
+NS_PER_MINUTE = 60 * 1_000_000_000
+
+
+def _minutes_since(ts: pd.Series, start) -> np.ndarray:
+    """Minutes elapsed from ``start`` for each timestamp, using int64 arithmetic.
+
+    Avoids building an intermediate Timedelta series. Missing timestamps yield NaN.
+    """
+    index = pd.DatetimeIndex(ts).as_unit("ns")
+    start = pd.Timestamp(start)
+    if (index.tz is None) != (start.tz is None):
+        raise TypeError("Cannot compare tz-naive and tz-aware timestamps")
+
+    minutes = (index.asi8 - start.as_unit("ns").value) / NS_PER_MINUTE
+    if index.hasnans:
+        minutes[index.isna()] = np.nan
+    return minutes
+
+
+def _timestamp_digits(ts: pd.Series) -> int | None:
+    """Fractional-second digits ``DataFrame.to_csv`` writes ``ts`` with (None for dates only)."""
+    ts = ts.dropna()
+    return csv_datetime_digits((ts - ts.dt.normalize()).to_numpy(dtype="int64"))
+
 
 class WatchDataProcessor:
     """Processor for watch export data files"""
@@ -211,45 +328,28 @@ class WatchDataProcessor:
         if gps_df.empty or "latitude" not in gps_df.columns:
             return gps_df
 
-        def haversine(lat1, lon1, lat2, lon2):
-            R = 6371  # Earth radius in km
-            dlat = np.radians(lat2 - lat1)
-            dlon = np.radians(lon2 - lon1)
-            a = (
-                np.sin(dlat / 2) ** 2
-                + np.cos(np.radians(lat1)) * np.cos(np.radians(lat2)) * np.sin(dlon / 2) ** 2
-            )
-            c = 2 * np.arctan2(np.sqrt(a), np.sqrt(1 - a))
-            return R * c
-
         gps_df = gps_df.sort_values("timestamp").reset_index(drop=True)
 
-        distances = []
-        speeds = []
+        lat = gps_df["latitude"].to_numpy(dtype=np.float64)
+        lon = gps_df["longitude"].to_numpy(dtype=np.float64)
+        timestamps = gps_df["timestamp"].to_numpy(dtype="datetime64[ns]")
 
-        for i in range(len(gps_df)):
-            if i == 0:
-                distances.append(0)
-                speeds.append(0)
-            else:
-                dist = haversine(
-                    gps_df.loc[i - 1, "latitude"],
-                    gps_df.loc[i - 1, "longitude"],
-                    gps_df.loc[i, "latitude"],
-                    gps_df.loc[i, "longitude"],
-                )
-                time_diff = (
-                    gps_df.loc[i, "timestamp"] - gps_df.loc[i - 1, "timestamp"]
-                ).total_seconds() / 3600
-                distances.append(dist)
-                speeds.append(dist / time_diff if time_diff > 0 else 0)
+        # Distance and elapsed hours between consecutive points (first point is 0)
+        distances = np.zeros(len(gps_df))
+        distances[1:] = haversine_km(lat[:-1], lon[:-1], lat[1:], lon[1:])
+        time_diff = np.zeros(len(gps_df))
+        time_diff[1:] = np.diff(timestamps) / np.timedelta64(1, "h")
 
-        gps_df["distance_km"] = distances
-        gps_df["cumulative_distance_km"] = np.cumsum(distances)
-        gps_df["speed_kmh"] = speeds
+        speed = np.zeros(len(gps_df))
+        np.divide(distances, time_diff, out=speed, where=time_diff > 0)
+
+        # Smooth speed data (remove outliers), max 15 km/h for marching
+        np.clip(speed, 0.0, 15.0, out=speed)
 
-        # Smooth speed data (remove outliers)
-        gps_df["speed_kmh"] = gps_df["speed_kmh"].clip(0, 15)  # Max 15 km/h for marching
+        gps_df["distance_km"] = distances
+        # Lat/lon stay float64 for precision; derived metrics fit in float32
+        gps_df["cumulative_distance_km"] = np.cumsum(distances).astype(np.float32)
+        gps_df["speed_kmh"] = speed.astype(np.float32)
 
         return gps_df
 
@@ -314,9 +414,9 @@ class WatchDataProcessor:
         }
 
         if "speed_kmh" in timeseries_df.columns:
-            metrics["avg_pace_kmh"] = round(timeseries_df["speed_kmh"].mean(), 2)
+            metrics["avg_pace_kmh"] = round(float(timeseries_df["speed_kmh"].mean()), 2)
             metrics["estimated_distance_km"] = (
-                round(timeseries_df["cumulative_distance_km"].max(), 2)
+                round(float(timeseries_df["cumulative_distance_km"].max()), 2)
                 if "cumulative_distance_km" in timeseries_df.columns
                 else None
             )
@@ -328,25 +428,21 @@ class WatchDataProcessor:
         if timeseries_df.empty or "heart_rate" not in timeseries_df.columns:
             return {}
 
-        hr_data = timeseries_df["heart_rate"].dropna()
-        total_samples = len(hr_data)
+        hr_data = timeseries_df["heart_rate"].to_numpy(dtype=np.float32, na_value=np.nan)
+        hr_data = hr_data[np.isfinite(hr_data)]
+        total_samples = hr_data.size
 
         if total_samples == 0:
             return {}
 
-        zones = {
-            "very_light_percent": round((hr_data < 100).sum() / total_samples * 100, 2),
-            "light_percent": round(
-                ((hr_data >= 100) & (hr_data < 120)).sum() / total_samples * 100, 2
-            ),
-            "moderate_percent": round(
-                ((hr_data >= 120) & (hr_data < 140)).sum() / total_samples * 100, 2
-            ),
-            "intense_percent": round(
-                ((hr_data >= 140) & (hr_data < 160)).sum() / total_samples * 100, 2
-            ),
-            "beast_mode_percent": round((hr_data >= 160).sum() / total_samples * 100, 2),
-        }
+        # Bin every sample into its zone in one pass: <100, 100-120, ..., >=160
+        counts = np.bincount(
+            np.searchsorted(HR_ZONE_EDGES, hr_data, side="right"),
+            minlength=len(HR_ZONE_NAMES),
+        )
+        percents = counts / total_samples * 100
+
+        zones = {name: round(percents[i], 2) for i, name in enumerate(HR_ZONE_NAMES)}
 
         return zones
 
@@ -382,6 +478,12 @@ class WatchDataProcessor:
             # Cadence is steps per minute; assuming ~1s sampling → steps per second = cadence / 60
             merged_df["steps"] = (cadence_data / 60).cumsum()
 
+        # Heart rate fits in float32 (NaN kept for missing samples)
+        if "heart_rate" in merged_df.columns:
+            merged_df["heart_rate"] = pd.to_numeric(
+                merged_df["heart_rate"], errors="coerce"
+            ).astype(np.float32)
+
         return merged_df
 
     def process_participant(self, participant_id: str, files: dict[str, Path]) -> dict:
@@ -453,16 +555,19 @@ class WatchDataProcessor:
     def _process_from_timeseries(
         self, participant_id: str, merged_df: pd.DataFrame, gps_df: pd.DataFrame
     ) -> dict:
-        """Process participant data from a merged timeseries DataFrame."""
+        """Process participant data from a merged timeseries DataFrame.
+
+        Both frames are modified in place; callers must pass frames they own.
+        """
         # Calculate time from march start
         if self.march_start_time:
-            merged_df["timestamp_minutes"] = (
-                merged_df["timestamp"] - self.march_start_time
-            ).dt.total_seconds() / 60
+            merged_df["timestamp_minutes"] = _minutes_since(
+                merged_df["timestamp"], self.march_start_time
+            )
         else:
-            merged_df["timestamp_minutes"] = (
-                merged_df["timestamp"] - merged_df["timestamp"].min()
-            ).dt.total_seconds() / 60
+            merged_df["timestamp_minutes"] = _minutes_since(
+                merged_df["timestamp"], merged_df["timestamp"].min()
+            )
 
         march_duration_minutes = int(merged_df["timestamp_minutes"].max())
 
@@ -509,17 +614,17 @@ class WatchDataProcessor:
         # Prepare GPS positions data
         gps_positions = None
         if not gps_df.empty:
-            gps_positions = gps_df.copy()
+            # gps_df is owned by this call, so the column is added in place
             if self.march_start_time:
-                gps_positions["timestamp_minutes"] = (
-                    gps_positions["timestamp"] - self.march_start_time
-                ).dt.total_seconds() / 60
+                gps_df["timestamp_minutes"] = _minutes_since(
+                    gps_df["timestamp"], self.march_start_time
+                )
             else:
-                gps_positions["timestamp_minutes"] = (
-                    gps_positions["timestamp"] - gps_positions["timestamp"].min()
-                ).dt.total_seconds() / 60
+                gps_df["timestamp_minutes"] = _minutes_since(
+                    gps_df["timestamp"], gps_df["timestamp"].min()
+                )
 
-            gps_positions = self._aggregate_gps_positions(gps_positions)
+            gps_positions = self._aggregate_gps_positions(gps_df)
 
         return {
             "participant_id": participant_id,
@@ -585,12 +690,16 @@ class WatchDataProcessor:
 
         # Concatenate all frames per format, then merge formats
         merged_gpx = (
-            pd.concat(all_gpx_dfs, ignore_index=True).sort_values("timestamp")
+            pd.concat(all_gpx_dfs, ignore_index=True, copy=False, sort=False).sort_values(
+                "timestamp"
+            )
             if all_gpx_dfs
             else pd.DataFrame()
         )
         merged_tcx = (
-            pd.concat(all_tcx_dfs, ignore_index=True).sort_values("timestamp")
+            pd.concat(all_tcx_dfs, ignore_index=True, copy=False, sort=False).sort_values(
+                "timestamp"
+            )
             if all_tcx_dfs
             else pd.DataFrame()
         )
@@ -650,121 +759,316 @@ class WatchDataProcessor:
 
         logger.info(f"Saved GPS crossing times for {len(self.gps_crossing_times)} participants to {output_file}")
 
-    def save_to_csv(self, results: list[dict], output_dir: Path):
-        """Save processed data to CSV files for database import."""
+    def _write_table(
+        self, df: pd.DataFrame, output_dir: Path, name: str, output_format: str = "csv"
+    ) -> Path:
+        """Write a DataFrame as ``<name>.csv`` or zstd-compressed ``<name>.parquet``.
+
+        CSV is always written by ``DataFrame.to_csv``, so the text format
+        (second-precision timestamps, minimal quoting, ``1.0`` for integral
+        floats) stays the one the loaders and downstream tools expect.
+        """
+        output_file = output_dir / f"{name}.{output_format}"
+        if output_format == "parquet" and not HAS_PYARROW:
+            raise ImportError("pyarrow is required for Parquet output")
+
+        if output_format == "parquet":
+            table = pa.Table.from_pandas(df, preserve_index=False)
+            pq.write_table(table, output_file, compression="zstd")
+        else:
+            df.to_csv(output_file, index=False)
+
+        return output_file
+
+    def _iter_tagged_frames(
+        self,
+        frames: list[pd.DataFrame],
+        march_ids: list[int],
+        user_ids: list[str],
+        columns: tuple[str, ...],
+        dtypes: dict[str, str],
+    ):
+        """Yield each frame reindexed to ``columns`` and tagged with its ids.
+
+        Columns a participant lacks are filled with NaN and every frame is cast
+        to ``dtypes``, so all frames share the same schema. Only one
+        participant's frame is materialized at a time.
+        """
+        for frame, march_id, user_id in zip(frames, march_ids, user_ids, strict=True):
+            frame = frame.reindex(columns=columns, copy=False)
+            frame["march_id"] = march_id
+            frame["user_id"] = user_id
+            yield frame.astype(dtypes, copy=False)
+
+    def _downcast(self, df: pd.DataFrame, dtypes: dict[str, str]) -> pd.DataFrame:
+        """Cast columns to compact dtypes, rounding floats cast to integers."""
+        df = df.copy()
+        for col, dtype in dtypes.items():
+            if col not in df.columns:
+                continue
+            series = pd.to_numeric(df[col], errors="coerce")
+            if pd.api.types.is_integer_dtype(pd.api.types.pandas_dtype(dtype)):
+                series = series.round()
+            df[col] = series.astype(dtype)
+        return df
+
+    def _write_stream(
+        self,
+        frames,
+        output_file: Path,
+        output_format: str = "csv",
+        parquet_dtypes: dict[str, str] | None = None,
+        engine: str = "pandas",
+        datetime_digits: dict[str, int | None] | None = None,
+    ) -> int:
+        """Append DataFrames with identical columns to one output file.
+
+        CSV is appended frame by frame with ``DataFrame.to_csv`` (the same text
+        format as ``_write_table``). ``to_csv`` picks the timestamp precision per
+        frame, so frames whose columns in ``datetime_digits`` need fewer
+        fractional digits than the whole file are formatted with the file's.
+        For Parquet output, ``parquet_dtypes`` downcasts columns before writing.
+        With ``engine="polars"`` the frames are concatenated into one Polars
+        frame and written by its multithreaded writers instead of streamed.
+        Returns the number of rows written.
+        """
+        if engine == "polars":
+            return self._write_polars(frames, output_file, output_format, parquet_dtypes)
+
+        if output_format == "parquet" and not HAS_PYARROW:
+            raise ImportError("pyarrow is required for Parquet output")
+
+        rows = 0
+        if output_format != "parquet":
+            with open(output_file, "w", newline="", buffering=1 << 20) as f:
+                header = True
+                for df in frames:
+                    for col, digits in (datetime_digits or {}).items():
+                        if _timestamp_digits(df[col]) != digits:
+                            df = df.assign(**{col: format_csv_datetimes(df[col], digits)})
+                    df.to_csv(f, header=header, index=False)
+                    header = False
+                    rows += len(df)
+            return rows
+
+        writer = None
+        schema = None
+        try:
+            for df in frames:
+                if parquet_dtypes:
+                    df = self._downcast(df, parquet_dtypes)
+                table = pa.Table.from_pandas(df, preserve_index=False)
+                if writer is None:
+                    schema = table.schema
+                    writer = pq.ParquetWriter(
+                        output_file,
+                        schema,
+                        compression="zstd",
+                        compression_level=3,
+                        use_dictionary=["march_id", "user_id"],
+                    )
+                writer.write_table(table.cast(schema))
+                rows += len(df)
+        finally:
+            if writer is not None:
+                writer.close()
+
+        return rows
+
+    def _write_polars(
+        self,
+        frames,
+        output_file: Path,
+        output_format: str = "csv",
+        parquet_dtypes: dict[str, str] | None = None,
+    ) -> int:
+        """Concatenate DataFrames with Polars and write them to one output file."""
+        if not HAS_POLARS:
+            raise ImportError("polars is required for the polars engine. Install: uv add polars")
+
+        parts = []
+        for df in frames:
+            if output_format == "parquet" and parquet_dtypes:
+                df = self._downcast(df, parquet_dtypes)
+            parts.append(pl.from_pandas(df))
+
+        combined = pl.concat(parts, how="vertical", rechunk=True)
+        if output_format == "parquet":
+            combined.write_parquet(output_file, compression="zstd", compression_level=3)
+        else:
+            # Timestamps get the precision to_csv would pick for them; missing ones
+            # count as midnight, which never adds precision
+            time_of_day_ns = combined.select(
+                pl.col(pl.Datetime).dt.time().cast(pl.Int64).fill_null(0)
+            ).to_numpy().ravel()
+            combined.write_csv(output_file, datetime_format=csv_datetime_format(time_of_day_ns))
+
+        return combined.height
+
+    def save_to_csv(
+        self,
+        results: list[dict],
+        output_dir: Path,
+        output_format: str = "csv",
+        engine: str = "pandas",
+    ):
+        """Save processed data to CSV (or Parquet) files for database import.
+
+        ``engine="polars"`` writes the timeseries and GPS files with Polars.
+        """
         output_dir = Path(output_dir)
         output_dir.mkdir(parents=True, exist_ok=True)
 
-        # Save aggregate metrics
-        metrics_data = []
+        # Split results into per-output columns in a single pass
+        metrics_data: list[dict] = []
+        zones_data: list[dict] = []
+        ts_parts: list[pd.DataFrame] = []
+        ts_march_ids: list[int] = []
+        ts_user_ids: list[str] = []
+        gps_parts: list[pd.DataFrame] = []
+        gps_march_ids: list[int] = []
+        gps_user_ids: list[str] = []
         for result in results:
-            if result.get("aggregate_metrics"):
-                row = {
-                    "march_id": result["march_id"],
-                    "user_id": result["participant_id"],
-                    **result["aggregate_metrics"],
-                }
-                metrics_data.append(row)
+            march_id = result.get("march_id")
+            participant_id = result.get("participant_id")
+
+            aggregate_metrics = result.get("aggregate_metrics")
+            if aggregate_metrics:
+                metrics_data.append(
+                    {"march_id": march_id, "user_id": participant_id, **aggregate_metrics}
+                )
+
+            hr_zones = result.get("hr_zones")
+            if hr_zones:
+                zones_data.append({"march_id": march_id, "user_id": participant_id, **hr_zones})
 
+            timeseries = result.get("timeseries")
+            if timeseries is not None and not timeseries.empty:
+                ts_parts.append(timeseries)
+                ts_march_ids.append(march_id)
+                ts_user_ids.append(participant_id)
+
+            gps_positions = result.get("gps_positions")
+            if gps_positions is not None and not gps_positions.empty:
+                gps_parts.append(gps_positions)
+                gps_march_ids.append(march_id)
+                gps_user_ids.append(participant_id)
+
+        # Save aggregate metrics
         if metrics_data:
             metrics_df = pd.DataFrame(metrics_data)
-            metrics_file = output_dir / "march_health_metrics.csv"
-            metrics_df.to_csv(metrics_file, index=False)
+            metrics_file = self._write_table(
+                metrics_df, output_dir, "march_health_metrics", output_format
+            )
             logger.info(f"Saved aggregate metrics to {metrics_file}")
 
         # Save HR zones
-        zones_data = []
-        for result in results:
-            if result.get("hr_zones"):
-                row = {
-                    "march_id": result["march_id"],
-                    "user_id": result["participant_id"],
-                    **result["hr_zones"],
-                }
-                zones_data.append(row)
-
         if zones_data:
             zones_df = pd.DataFrame(zones_data)
-            zones_file = output_dir / "march_hr_zones.csv"
-            zones_df.to_csv(zones_file, index=False)
+            zones_file = self._write_table(zones_df, output_dir, "march_hr_zones", output_format)
             logger.info(f"Saved HR zones to {zones_file}")
 
-        # Save timeseries data
-        all_timeseries = []
-        for result in results:
-            if "timeseries" in result and not result["timeseries"].empty:
-                ts_df = result["timeseries"].copy()
-                ts_df["march_id"] = result["march_id"]
-                ts_df["user_id"] = result["participant_id"]
-                all_timeseries.append(ts_df)
-
-        if all_timeseries:
-            timeseries_df = pd.concat(all_timeseries, ignore_index=True)
-            columns = [
-                "march_id",
-                "user_id",
-                "timestamp",
-                "timestamp_minutes",
-                "heart_rate",
-                "steps",
-                "speed_kmh",
-                "cumulative_distance_km",
-            ]
-            timeseries_df = timeseries_df[[col for col in columns if col in timeseries_df.columns]]
-
-            if "timestamp_minutes" in timeseries_df.columns:
-                negative_count = (timeseries_df["timestamp_minutes"] < 0).sum()
-                if negative_count > 0:
-                    logger.info(
-                        f"Removing {negative_count} rows with negative timestamps (before march start)"
-                    )
-                    timeseries_df = timeseries_df[timeseries_df["timestamp_minutes"] >= 0]
+        # Timeseries and GPS files share no data, so write them concurrently.
+        # The GPS file stays on this thread: the numba kernel in step_geometry
+        # uses numba's thread pool, which must not be launched from a worker.
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            timeseries_future = None
+            if ts_parts:
+                timeseries_future = executor.submit(
+                    self._save_section,
+                    ts_parts,
+                    ts_march_ids,
+                    ts_user_ids,
+                    TIMESERIES_COLS,
+                    TIMESERIES_DTYPES,
+                    TIMESERIES_PARQUET_DTYPES,
+                    output_dir / f"march_timeseries_data.{output_format}",
+                    "timeseries data",
+                    output_format,
+                    engine,
+                )
+            if gps_parts:
+                self._save_section(
+                    gps_parts,
+                    gps_march_ids,
+                    gps_user_ids,
+                    GPS_COLS,
+                    GPS_DTYPES,
+                    GPS_PARQUET_DTYPES,
+                    output_dir / f"march_gps_positions.{output_format}",
+                    "GPS positions",
+                    output_format,
+                    engine,
+                    extra_transform=self._add_gps_geometry,
+                )
+            if timeseries_future is not None:
+                timeseries_future.result()
+
+    def _add_gps_geometry(self, frame: pd.DataFrame) -> pd.DataFrame:
+        """Rename altitude to elevation and add bearing/turning angle columns."""
+        frame = frame.rename(columns={"altitude": "elevation"})
+        _, frame["bearing"], frame["turning_angle"] = step_geometry(
+            frame["latitude"].to_numpy(), frame["longitude"].to_numpy()
+        )
+        return frame
 
-            timeseries_file = output_dir / "march_timeseries_data.csv"
-            timeseries_df.to_csv(timeseries_file, index=False)
-            logger.info(f"Saved timeseries data to {timeseries_file}")
+    def _save_section(
+        self,
+        frames: list[pd.DataFrame],
+        march_ids: list[int],
+        user_ids: list[str],
+        columns: tuple[str, ...],
+        dtypes: dict[str, str],
+        parquet_dtypes: dict[str, str],
+        out_path: Path,
+        label: str,
+        output_format: str = "csv",
+        engine: str = "pandas",
+        extra_transform: Callable[[pd.DataFrame], pd.DataFrame] | None = None,
+    ):
+        """Tag, filter and stream one per-participant output (timeseries or GPS).
 
-        # Save GPS positions
-        all_gps = []
-        for result in results:
-            if result.get("gps_positions") is not None and not result["gps_positions"].empty:
-                gps_df = result["gps_positions"].copy()
-                gps_df["march_id"] = result["march_id"]
-                gps_df["user_id"] = result["participant_id"]
-                all_gps.append(gps_df)
-
-        if all_gps:
-            gps_positions_df = pd.concat(all_gps, ignore_index=True)
-            columns = [
-                "march_id",
-                "user_id",
-                "timestamp_minutes",
-                "latitude",
-                "longitude",
-                "altitude",
-                "speed_kmh",
-            ]
-            gps_positions_df = gps_positions_df[
-                [col for col in columns if col in gps_positions_df.columns]
+        Rows before the march start are dropped, then ``extra_transform`` (if
+        given) is applied to each participant's frame before it is written.
+        """
+        negative_count = 0
+
+        # Timestamps get the precision to_csv would give the concatenated file
+        datetime_digits = None
+        if output_format != "parquet" and "timestamp" in columns:
+            timestamps = [
+                frame.loc[frame["timestamp_minutes"] >= 0, "timestamp"]
+                for frame in frames
+                if "timestamp" in frame.columns
             ]
-
-            # Rename altitude to elevation
-            gps_positions_df.rename(columns={"altitude": "elevation"}, inplace=True)
-
-            if "timestamp_minutes" in gps_positions_df.columns:
-                negative_count = (gps_positions_df["timestamp_minutes"] < 0).sum()
-                if negative_count > 0:
-                    logger.info(
-                        f"Removing {negative_count} GPS rows with negative timestamps (before march start)"
-                    )
-                    gps_positions_df = gps_positions_df[gps_positions_df["timestamp_minutes"] >= 0]
-
-            if "latitude" in gps_positions_df.columns and "longitude" in gps_positions_df.columns:
-                gps_positions_df["bearing"] = None  # Placeholder for now
-
-            gps_file = output_dir / "march_gps_positions.csv"
-            gps_positions_df.to_csv(gps_file, index=False)
-            logger.info(f"Saved GPS positions to {gps_file}")
+            if timestamps:
+                datetime_digits = {"timestamp": _timestamp_digits(pd.concat(timestamps))}
+
+        def section_frames():
+            nonlocal negative_count
+            for frame in self._iter_tagged_frames(frames, march_ids, user_ids, columns, dtypes):
+                before_start = frame["timestamp_minutes"] < 0
+                if before_start.any():
+                    negative_count += int(before_start.sum())
+                    frame = frame[~before_start]
+                if extra_transform is not None:
+                    frame = extra_transform(frame)
+                yield frame
+
+        self._write_stream(
+            section_frames(),
+            out_path,
+            output_format,
+            parquet_dtypes,
+            engine=engine,
+            datetime_digits=datetime_digits,
+        )
+        if negative_count > 0:
+            logger.info(
+                f"Removed {negative_count} rows from {label} with negative timestamps "
+                "(before march start)"
+            )
+        logger.info(f"Saved {label} to {out_path}")
 
 
 def main():
@@ -826,6 +1130,20 @@ def main():
         "--output", default="./data/output", help="Output directory for CSV files (default: ./data/output)"
     )
 
+    parser.add_argument(
+        "--output-format",
+        choices=["csv", "parquet"],
+        default="csv",
+        help="Output file format; parquet is zstd-compressed (default: csv)",
+    )
+
+    parser.add_argument(
+        "--engine",
+        choices=["pandas", "polars"],
+        default="pandas",
+        help="Library used to write the timeseries and GPS files (default: pandas)",
+    )
+
     args = parser.parse_args()
 
     march_start_time = None
@@ -879,7 +1197,9 @@ def main():
             logger.error("No data was successfully processed")
             sys.exit(1)
 
-        processor.save_to_csv(results, args.output)
+        processor.save_to_csv(
+            results, args.output, output_format=args.output_format, engine=args.engine
+        )
         processor.save_gps_crossing_times(args.output)
 
         logger.info(f"Processing complete! Output saved to {args.output}")
@@ -6,6 +6,7 @@ import pandas as pd
 import pytest
 from werkzeug.security import generate_password_hash
 
+from src.app.components import auth as auth_components
 from utils.auth import (
     authenticate_user,
     create_user,
@@ -368,3 +369,92 @@ def test_role_permissions_matrix(role, expected_access):
     # Test participant access (different user)
     participant_access = user_can_view_participant(1, 2, role)  # Different user IDs
     assert participant_access == expected_access
+
+
+@pytest.mark.unit
+class TestLoginThrottle:
+    """Test the failed-login throttle in the login callback"""
+
+    @pytest.fixture(autouse=True)
+    def clear_fail_counts(self):
+        auth_components._fail_counts.clear()
+        yield
+        auth_components._fail_counts.clear()
+
+    def _login(self, password, now):
+        with patch('src.app.components.auth.time.monotonic', return_value=now):
+            return auth_components.handle_login(1, None, 'test_user', password)
+
+    @patch('src.app.components.auth.authenticate_user', return_value=None)
+    def test_sixth_attempt_rejected_without_authenticating(self, mock_authenticate):
+        """After MAX_FAILED_LOGINS failures the password is no longer checked"""
+        for attempt in range(auth_components.MAX_FAILED_LOGINS):
+            self._login('wrong_password', now=100.0 + attempt)
+        assert mock_authenticate.call_count == auth_components.MAX_FAILED_LOGINS
+
+        error, pathname = self._login('wrong_password', now=106.0)
+
+        assert mock_authenticate.call_count == auth_components.MAX_FAILED_LOGINS
+        assert error is not None
+        assert pathname is auth_components.dash.no_update
+
+    @patch('src.app.components.auth.authenticate_user', return_value=None)
+    def test_throttle_resets_after_window(self, mock_authenticate):
+        """Attempts are checked again once the failure window has expired"""
+        for attempt in range(auth_components.MAX_FAILED_LOGINS):
+            self._login('wrong_password', now=100.0 + attempt)
+
+        self._login('wrong_password', now=100.0 + auth_components.FAILED_LOGIN_WINDOW_S + 1)
+
+        assert mock_authenticate.call_count == auth_components.MAX_FAILED_LOGINS + 1
+        assert auth_components._fail_counts['test_user'][0] == 1
+
+    @patch('src.app.components.auth.login_user')
+    @patch('src.app.components.auth.authenticate_user')
+    def test_successful_login_resets_failures(self, mock_authenticate, mock_login_user, sample_user_data):
+        """A successful login clears the failure count for the username"""
+        mock_authenticate.return_value = None
+        for attempt in range(auth_components.MAX_FAILED_LOGINS - 1):
+            self._login('wrong_password', now=100.0 + attempt)
+
+        mock_authenticate.return_value = sample_user_data
+        with patch.dict('sys.modules', {'src.app.main': Mock()}):
+            _, pathname = self._login('correct_password', now=110.0)
+
+        assert pathname == "/"
+        assert 'test_user' not in auth_components._fail_counts
+
+        mock_authenticate.return_value = None
+        for attempt in range(auth_components.MAX_FAILED_LOGINS - 1):
+            self._login('wrong_password', now=111.0 + attempt)
+        assert mock_authenticate.call_count == 2 * auth_components.MAX_FAILED_LOGINS - 1
+
+    def test_tracked_usernames_are_bounded(self):
+        """Expired entries are pruned and the table never exceeds its cap"""
+        with patch.object(auth_components, 'MAX_TRACKED_LOGINS', 3):
+            for i in range(5):
+                auth_components._record_failed_login(f'user{i}', now=100.0)
+            assert list(auth_components._fail_counts) == ['user2', 'user3', 'user4']
+
+            auth_components._record_failed_login('late_user', now=100.0 + auth_components.FAILED_LOGIN_WINDOW_S + 1)
+            assert list(auth_components._fail_counts) == ['late_user']
+
+
+@pytest.mark.unit
+class TestCachedComponents:
+    """Test the cached static layouts"""
+
+    @pytest.mark.parametrize('factory, args', [
+        (auth_components.create_login_form, (False,)),
+        (auth_components.create_login_form, (True,)),
+        (auth_components.create_access_denied, ("Please log in to view march data.",)),
+        (auth_components.create_access_denied, ()),
+        (auth_components.create_loading_spinner, ()),
+    ])
+    def test_second_call_returns_unmodified_tree(self, factory, args):
+        """Repeated calls share one tree that still matches a freshly built one"""
+        first = factory(*args)
+        second = factory(*args)
+
+        assert second is first
+        assert repr(second) == repr(factory.__wrapped__(*args))
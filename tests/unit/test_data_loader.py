@@ -0,0 +1,48 @@
+"""Unit tests for loading processed march data into the database"""
+
+from unittest.mock import Mock
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.processing.data_loader import (
+    load_csv_file,
+    load_march_timeseries_data,
+    map_participant_ids,
+)
+from src.processing.watch_processor import WatchDataProcessor
+
+
+@pytest.mark.unit
+class TestLoadMarchTimeseriesData:
+    """Test building timeseries records from processed output"""
+
+    def test_parquet_output_with_gap(self, tmp_path):
+        """Resampled gaps read back from Parquet as NA load as NULL"""
+        pytest.importorskip("pyarrow")
+        timeseries = pd.DataFrame({
+            'timestamp': pd.date_range('2024-03-01 08:00:00', periods=3, freq='1min'),
+            'timestamp_minutes': [0.0, 1.0, 2.0],
+            'heart_rate': np.array([110.0, np.nan, 118.0], dtype=np.float32),
+            'steps': [0.0, np.nan, 120.0],
+            'speed_kmh': [0.0, np.nan, 5.0],
+            'cumulative_distance_km': [0.0, 0.05, 0.1],
+        })
+        results = [{'march_id': 1, 'participant_id': 'SM001', 'timeseries': timeseries}]
+        WatchDataProcessor(data_dir=tmp_path, march_id=1).save_to_csv(
+            results, tmp_path, output_format='parquet'
+        )
+
+        df = load_csv_file(tmp_path, 'march_timeseries_data.csv')
+        assert df['steps'].isna().iloc[1]
+        df = map_participant_ids(df, {'SM001': 7})
+        conn = Mock()
+
+        assert load_march_timeseries_data(conn, df, march_id=1) == 3
+
+        records = conn.execute.call_args_list[-1].args[1]
+        assert [r['cumulative_steps'] for r in records] == [0, None, 120]
+        assert [r['heart_rate'] for r in records] == [110, None, 118]
+        assert [r['estimated_speed_kmh'] for r in records] == [0.0, None, 5.0]
+        assert all(r['user_id'] == 7 for r in records)
@@ -0,0 +1,198 @@
+"""Unit tests for the march data merger"""
+
+import logging
+
+import pandas as pd
+import pytest
+
+from src.processing.data_merger import HAS_POLARS, MarchDataMerger
+
+
+@pytest.fixture
+def march_csv_files(tmp_path):
+    """Watch and step CSVs for three participants
+
+    SM001 has no step data, SM002 has a valid stride length and SM003 an invalid
+    one. One watch timestamp has a sub-second part.
+    """
+    watch_times = pd.date_range('2024-03-01 08:00:00', periods=6, freq='10s')
+    watch_times = watch_times.where(watch_times != watch_times[3], watch_times[3] + pd.Timedelta('500ms'))
+    df_watch = pd.DataFrame({
+        'march_id': 1,
+        'user_id': ['SM002'] * 6 + ['SM001'] * 6 + ['SM003'] * 6,
+        'timestamp': watch_times.append([watch_times, watch_times]),
+        'timestamp_minutes': [i / 6 for i in range(6)] * 3,
+        'heart_rate': [100, 102, None, 105, 107, 110] * 3,
+        'steps': [0, 10, 20, 30, 40, 50] * 3,
+        'cumulative_distance_km': [0.0, 0.01, 0.02, 0.03, 0.04, 0.05] * 2
+                                  + [0.0, 0.001, 0.002, 0.003, 0.004, 0.005],
+    })
+    df_steps = pd.DataFrame({
+        'march_id': 1,
+        'user_id': ['SM002'] * 4 + ['SM003'] * 4,
+        'timestamp': (watch_times[:4] + pd.Timedelta(seconds=2)).append(watch_times[:4]),
+        'timestamp_minutes': [i / 6 for i in range(4)] * 2,
+        'cumulative_steps': [0, 14, 27, 41] * 2,
+        'steps_per_second': [0.0, 1.4, 1.3, 1.4] * 2,
+    })
+
+    watch_file = tmp_path / 'march_timeseries_data.csv'
+    step_file = tmp_path / 'march_step_data.csv'
+    df_watch.to_csv(watch_file, index=False)
+    df_steps.to_csv(step_file, index=False)
+    return watch_file, step_file
+
+
+@pytest.mark.unit
+class TestLoadData:
+    """Test loading watch and step data"""
+
+    def test_user_id_shares_sorted_categories(self, march_csv_files):
+        """Both frames use one sorted set of user_id categories"""
+        df_watch, df_steps = MarchDataMerger(*march_csv_files).load_data()
+
+        assert list(df_watch['user_id'].cat.categories) == ['SM001', 'SM002', 'SM003']
+        assert df_watch['user_id'].dtype == df_steps['user_id'].dtype
+
+    def test_null_user_id(self, march_csv_files):
+        """Rows without a user_id load as nulls instead of failing"""
+        watch_file, step_file = march_csv_files
+        df = pd.read_csv(watch_file)
+        df.loc[0, 'user_id'] = None
+        df.to_csv(watch_file, index=False)
+
+        df_watch, df_steps = MarchDataMerger(watch_file, step_file).load_data()
+
+        assert list(df_watch['user_id'].cat.categories) == ['SM001', 'SM002', 'SM003']
+        assert df_watch['user_id'].isna().sum() == 1
+        assert df_steps['user_id'].notna().all()
+
+
+def _read_output(output_file):
+    """Read merged output back with timestamps in nanoseconds and plain string user_ids"""
+    if output_file.suffix == '.parquet':
+        df = pd.read_parquet(output_file)
+    else:
+        df = pd.read_csv(output_file, parse_dates=['timestamp'])
+    df['timestamp'] = df['timestamp'].astype('datetime64[ns]')
+    df['user_id'] = df['user_id'].astype(str)
+    df['march_id'] = df['march_id'].astype('int64')
+    return df
+
+
+@pytest.mark.unit
+@pytest.mark.skipif(not HAS_POLARS, reason="polars is not installed")
+class TestPolarsEngine:
+    """Test that the polars engine writes the same records as the pandas engine"""
+
+    @pytest.mark.parametrize('output_format', ['csv', 'parquet'])
+    @pytest.mark.parametrize('merge_on', ['timestamp', 'timestamp_minutes'])
+    def test_matches_pandas_engine(self, march_csv_files, tmp_path, caplog, merge_on, output_format):
+        """Both engines produce equal frames and the same warnings"""
+        merger = MarchDataMerger(*march_csv_files, merge_on=merge_on)
+
+        with caplog.at_level(logging.WARNING, logger='src.processing.data_merger'):
+            df_watch, df_steps = merger.load_data()
+            merger.save_merged_data(
+                merger.merge_data(df_watch, df_steps), tmp_path / 'pandas', output_format=output_format
+            )
+        pandas_warnings = sorted(r.getMessage() for r in caplog.records)
+        caplog.clear()
+
+        with caplog.at_level(logging.WARNING, logger='src.processing.data_merger'):
+            records = merger.merge_polars(tmp_path / 'polars', output_format=output_format)
+        polars_warnings = sorted(r.getMessage() for r in caplog.records)
+
+        output_name = 'march_timeseries_data_merged.' + output_format
+        df_pandas = _read_output(tmp_path / 'pandas' / output_name)
+        df_polars = _read_output(tmp_path / 'polars' / output_name)
+
+        assert records == len(df_pandas)
+        if output_format == 'csv':
+            polars_text = (tmp_path / 'polars' / output_name).read_text()
+            assert polars_text == (tmp_path / 'pandas' / output_name).read_text()
+        pd.testing.assert_frame_equal(df_polars, df_pandas, check_dtype=False)
+        assert df_pandas['timestamp'].dt.microsecond.any()
+        assert polars_warnings == pandas_warnings
+        assert any('Invalid stride length' in message for message in pandas_warnings)
+        assert any('No step data found for SM001' in message for message in pandas_warnings)
+
+
+@pytest.fixture
+def summary_csv_files(tmp_path):
+    """Health metrics for two participants and a step summary for one of them"""
+    health_file = tmp_path / 'march_health_metrics.csv'
+    step_summary_file = tmp_path / 'march_step_summary.csv'
+    pd.DataFrame({
+        'march_id': [1, 1],
+        'user_id': ['SM001', 'SM002'],
+        'avg_hr': [123.5, 130.0],
+        'total_steps': [1000.0, None],
+        'max_hr': [180, 175],
+    }).to_csv(health_file, index=False)
+    pd.DataFrame({
+        'march_id': [1],
+        'user_id': ['SM001'],
+        'total_steps': [1200],
+        'avg_steps_per_second': [1.8],
+        'window_size_seconds': [10.0],
+    }).to_csv(step_summary_file, index=False)
+    return health_file, step_summary_file
+
+
+@pytest.mark.unit
+class TestCsvOutput:
+    """Test that merged CSV files keep the DataFrame.to_csv text format"""
+
+    def test_merged_timeseries(self, march_csv_files, tmp_path):
+        merger = MarchDataMerger(*march_csv_files)
+        df_merged = merger.merge_data(*merger.load_data())
+
+        merger.save_merged_data(df_merged, tmp_path / 'out')
+
+        text = (tmp_path / 'out' / 'march_timeseries_data_merged.csv').read_text()
+        assert text == df_merged.to_csv(index=False)
+        # One sub-second timestamp gives every timestamp milliseconds
+        assert text.splitlines()[1] == '1,SM001,2024-03-01 08:00:00.000,0.0,100.0,0.0,0.0,'
+
+    def test_merged_health_metrics(self, march_csv_files, summary_csv_files, tmp_path):
+        health_file, step_summary_file = summary_csv_files
+        merger = MarchDataMerger(*march_csv_files, watch_summary_file=health_file,
+                                 step_summary_file=step_summary_file)
+
+        merger.merge_summary_files(tmp_path / 'out')
+
+        expected = pd.DataFrame({
+            'march_id': [1, 1],
+            'user_id': ['SM001', 'SM002'],
+            'avg_hr': [123.5, 130.0],
+            'total_steps': [1200.0, None],
+            'max_hr': [180, 175],
+            'avg_steps_per_second': [1.8, None],
+            'window_size_seconds': [10.0, None],
+        })
+        text = (tmp_path / 'out' / 'march_health_metrics_merged.csv').read_text()
+        assert text == expected.to_csv(index=False)
+        assert text.splitlines()[1] == '1,SM001,123.5,1200.0,180,1.8,10.0'
+
+
+@pytest.mark.unit
+class TestMergeSummaryFiles:
+    """Test merging step summaries into the health metrics"""
+
+    def test_duplicate_step_summary(self, march_csv_files, summary_csv_files, tmp_path, caplog):
+        """A repeated step summary row keeps the last one instead of failing the merge"""
+        health_file, step_summary_file = summary_csv_files
+        df_step_summary = pd.read_csv(step_summary_file)
+        df_step_summary = pd.concat([df_step_summary.assign(total_steps=900), df_step_summary])
+        df_step_summary.to_csv(step_summary_file, index=False)
+        merger = MarchDataMerger(*march_csv_files, watch_summary_file=health_file,
+                                 step_summary_file=step_summary_file)
+
+        with caplog.at_level(logging.WARNING, logger='src.processing.data_merger'):
+            merger.merge_summary_files(tmp_path / 'out')
+
+        df_merged = pd.read_csv(tmp_path / 'out' / 'march_health_metrics_merged.csv')
+        assert list(df_merged['user_id']) == ['SM001', 'SM002']
+        assert df_merged.loc[0, 'total_steps'] == 1200
+        assert any('1 duplicate step summary rows' in r.getMessage() for r in caplog.records)
@@ -0,0 +1,198 @@
+"""Unit tests for the signal processing filters"""
+
+from unittest.mock import Mock
+
+import numpy as np
+import pytest
+from scipy.signal import sosfiltfilt
+
+from src.processing import filters
+
+
+@pytest.fixture
+def gpu_probe():
+    """Reset the cached GPU probe around a test"""
+    filters._gpu_available.cache_clear()
+    yield filters._gpu_available
+    filters._gpu_available.cache_clear()
+
+
+@pytest.mark.unit
+class TestGpuBackend:
+    """Test backend selection and the CuPy path"""
+
+    def test_failed_probe_falls_back_to_cpu(self, monkeypatch, gpu_probe):
+        """A CUDA error while probing the device disables the GPU instead of raising"""
+        cupy = Mock()
+        cupy.cuda.is_available.side_effect = RuntimeError("CUDA driver version is insufficient")
+        monkeypatch.setattr(filters, 'HAS_CUPY', True)
+        monkeypatch.setattr(filters, 'cp', cupy, raising=False)
+
+        assert filters._use_gpu("auto", 10 * filters._GPU_MIN_SAMPLES) is False
+        with pytest.raises(ImportError):
+            filters._use_gpu("gpu", 10)
+
+    def test_probe_is_lazy(self, monkeypatch, gpu_probe):
+        """Short signals and the cpu backend never touch the device"""
+        cupy = Mock()
+        monkeypatch.setattr(filters, 'HAS_CUPY', True)
+        monkeypatch.setattr(filters, 'cp', cupy, raising=False)
+
+        assert filters._use_gpu("cpu", 10 * filters._GPU_MIN_SAMPLES) is False
+        assert filters._use_gpu("auto", filters._GPU_MIN_SAMPLES) is False
+        cupy.cuda.is_available.assert_not_called()
+
+    @pytest.mark.parametrize('dtype', [np.float64, np.float32])
+    def test_gpu_matches_cpu(self, gpu_probe, dtype):
+        """The CuPy path agrees with the CPU path to floating-point tolerance"""
+        pytest.importorskip("cupy")
+        if not gpu_probe():
+            pytest.skip("no CUDA device available")
+
+        fs = 50.0
+        rng = np.random.default_rng(0)
+        signal = rng.standard_normal(2 * filters._GPU_MIN_SAMPLES).astype(dtype)
+        rtol = 1e-4 if dtype == np.float32 else 1e-9
+
+        for filter_fn, args in [
+            (filters.highpass_filter, (0.5, fs)),
+            (filters.lowpass_filter, (5.0, fs)),
+            (filters.bandpass_filter, (0.5, 5.0, fs)),
+        ]:
+            cpu = filter_fn(signal, *args, backend="cpu")
+            gpu = filter_fn(signal, *args, backend="gpu")
+            assert gpu.dtype == cpu.dtype
+            assert np.allclose(gpu, cpu, rtol=rtol, atol=rtol * np.abs(cpu).max())
+
+
+FS = 50.0
+FILTER_DESIGNS = [
+    ('highpass', (0.5,)),
+    ('lowpass', (5.0,)),
+    ('bandpass', (0.5, 5.0)),
+]
+
+
+def _reference(btype, cutoffs, order, dtype, signals):
+    """scipy.signal.sosfiltfilt with the same cached sections"""
+    sos = filters._design_sos(order, btype, cutoffs, FS, np.dtype(dtype))
+    return sosfiltfilt(sos, signals, axis=-1)
+
+
+def _public_filter(btype, cutoffs, order, signal):
+    filter_fn = {
+        'highpass': filters.highpass_filter,
+        'lowpass': filters.lowpass_filter,
+        'bandpass': filters.bandpass_filter,
+    }[btype]
+    return filter_fn(signal, *cutoffs, FS, order=order, backend="cpu")
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize('dtype', [np.float64, np.float32])
+@pytest.mark.parametrize('order', [2, 3, 5, 6])
+@pytest.mark.parametrize('btype, cutoffs', FILTER_DESIGNS)
+class TestZeroPhaseFilters:
+    """Every zero-phase path reproduces scipy.signal.sosfiltfilt bit for bit"""
+
+    @pytest.fixture
+    def design(self, btype, cutoffs, order, dtype):
+        return filters._filtfilt_design(order, btype, cutoffs, FS, np.dtype(dtype))
+
+    @staticmethod
+    def _signal(n_samples, dtype, seed=0):
+        rng = np.random.default_rng(seed)
+        t = np.arange(n_samples) / FS
+        return (np.sin(2 * np.pi * 1.5 * t) + rng.standard_normal(n_samples)).astype(dtype)
+
+    @pytest.mark.parametrize('extra_samples', [1, 2, 1000])
+    def test_fast_path(self, btype, cutoffs, order, dtype, design, extra_samples):
+        sos, zi, padlen = design
+        x = self._signal(padlen + extra_samples, dtype)
+
+        result = filters._sosfiltfilt_fast(sos, zi, x, padlen)
+
+        assert result.dtype == np.dtype(dtype)
+        np.testing.assert_array_equal(result, _reference(btype, cutoffs, order, dtype, x))
+
+    @pytest.mark.skipif(not filters.HAS_NUMBA, reason="numba is not installed")
+    @pytest.mark.parametrize('extra_samples', [1, 2, 1000])
+    def test_numba_path(self, btype, cutoffs, order, dtype, design, extra_samples):
+        sos, zi, padlen = design
+        x = self._signal(padlen + extra_samples, dtype)
+
+        result = filters._filtfilt_tdf2(sos, zi, x, padlen, np.empty_like(x))
+
+        assert result.dtype == np.dtype(dtype)
+        np.testing.assert_array_equal(result, _reference(btype, cutoffs, order, dtype, x))
+
+    @pytest.mark.parametrize('extra_samples', [1, 1000])
+    def test_channel_path(self, btype, cutoffs, order, dtype, design, extra_samples):
+        padlen = design[2]
+        signals = np.stack([self._signal(padlen + extra_samples, dtype, seed) for seed in range(3)])
+
+        result = filters._sosfiltfilt_channels(signals, design, backend="cpu")
+
+        assert result.dtype == np.dtype(dtype)
+        np.testing.assert_array_equal(result, _reference(btype, cutoffs, order, dtype, signals))
+
+    @pytest.mark.filterwarnings("ignore:Signal length .* is shorter than recommended")
+    @pytest.mark.parametrize('n_samples', [None, 20_000])
+    def test_public_filter(self, btype, cutoffs, order, dtype, design, n_samples):
+        # Shortest signal the length validation accepts, or one past the fast-path limit
+        n_samples = n_samples or max(design[2], 6 * order + 1) + 1
+        x = self._signal(n_samples, dtype)
+
+        result = _public_filter(btype, cutoffs, order, x)
+
+        assert result.dtype == np.dtype(dtype)
+        np.testing.assert_array_equal(result, _reference(btype, cutoffs, order, dtype, x))
+
+
+def _per_segment_reference(values, bounds, find_max):
+    arg = np.argmax if find_max else np.argmin
+    segments = zip(bounds[:-1], bounds[1:], strict=True)
+    return np.array([lo + arg(values[lo:hi]) for lo, hi in segments], dtype=np.intp)
+
+
+SEGMENT_CASES = {
+    'random': (np.random.default_rng(0).standard_normal(200), np.array([0, 7, 8, 30, 31, 120, 200])),
+    'offset_bounds': (np.random.default_rng(1).standard_normal(100), np.array([10, 11, 40, 41, 90])),
+    'ties': (np.array([3.0, 1.0, 3.0, 1.0, 2.0, 2.0, 2.0, 5.0, 5.0]), np.array([0, 4, 7, 9])),
+    'nan_first': (np.array([np.nan, 1.0, 9.0, 0.0, 4.0, np.nan, 4.0, 0.0]), np.array([0, 3, 5, 8])),
+    'nan_inside': (np.array([1.0, np.nan, 9.0, np.nan, -1.0, 2.0]), np.array([0, 3, 6])),
+    'single_samples': (np.array([4.0, -2.0, np.nan, 7.0]), np.array([0, 1, 2, 3, 4])),
+}
+
+
+@pytest.fixture(params=['numba', 'numpy'])
+def segment_kernel(request, monkeypatch):
+    """Run segment_argmax/segment_argmin through the numba kernel or the NumPy fallback"""
+    if request.param == 'numba':
+        if not filters.HAS_NUMBA:
+            pytest.skip("numba is not installed")
+    else:
+        monkeypatch.setattr(filters, 'HAS_NUMBA', False)
+    return request.param
+
+
+@pytest.mark.unit
+class TestSegmentArgext:
+    """Test segment_argmax/segment_argmin against per-segment np.argmax/np.argmin"""
+
+    @pytest.mark.parametrize('case', SEGMENT_CASES)
+    @pytest.mark.parametrize('find_max', [True, False])
+    def test_matches_per_segment_argext(self, segment_kernel, case, find_max):
+        values, bounds = SEGMENT_CASES[case]
+        segment_argext = filters.segment_argmax if find_max else filters.segment_argmin
+
+        result = segment_argext(values, bounds)
+
+        np.testing.assert_array_equal(result, _per_segment_reference(values, bounds, find_max))
+
+    @pytest.mark.parametrize('bounds', [np.array([], dtype=np.intp), np.array([3])])
+    def test_no_segments(self, segment_kernel, bounds):
+        values = np.arange(5.0)
+
+        assert filters.segment_argmax(values, bounds).shape == (0,)
+        assert filters.segment_argmin(values, bounds).shape == (0,)
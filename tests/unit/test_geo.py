@@ -0,0 +1,128 @@
+"""Unit tests for the GPS geometry helpers"""
+
+import math
+
+import numpy as np
+import pytest
+
+from src.processing import geo
+
+
+def _haversine_reference(lat1, lon1, lat2, lon2):
+    """Scalar haversine distance in km"""
+    lat1, lon1, lat2, lon2 = map(math.radians, (lat1, lon1, lat2, lon2))
+    a = (math.sin((lat2 - lat1) / 2) ** 2
+         + math.cos(lat1) * math.cos(lat2) * math.sin((lon2 - lon1) / 2) ** 2)
+    return 2 * geo.EARTH_RADIUS_KM * math.asin(math.sqrt(a))
+
+
+def _bearing_reference(lat1, lon1, lat2, lon2):
+    """Scalar initial bearing in degrees"""
+    lat1, lon1, lat2, lon2 = map(math.radians, (lat1, lon1, lat2, lon2))
+    y = math.sin(lon2 - lon1) * math.cos(lat2)
+    x = math.cos(lat1) * math.sin(lat2) - math.sin(lat1) * math.cos(lat2) * math.cos(lon2 - lon1)
+    return math.degrees(math.atan2(y, x)) % 360
+
+
+def _track_from_headings(headings_deg, step_m=5.0, lat0=47.0, lon0=8.0):
+    """Track that moves ``step_m`` metres along each heading (degrees clockwise from north)"""
+    radius_m = geo.EARTH_RADIUS_KM * 1000
+    lat, lon = [lat0], [lon0]
+    for heading in np.radians(headings_deg):
+        cos_lat = math.cos(math.radians(lat[-1]))
+        lat.append(lat[-1] + math.degrees(step_m * math.cos(heading) / radius_m))
+        lon.append(lon[-1] + math.degrees(step_m * math.sin(heading) / (radius_m * cos_lat)))
+    return np.array(lat), np.array(lon)
+
+
+@pytest.fixture
+def gps_track():
+    """Random walk of 500 points with a few stationary steps"""
+    rng = np.random.default_rng(0)
+    lat = 47.37 + np.cumsum(rng.normal(0, 5e-5, 500))
+    lon = 8.54 + np.cumsum(rng.normal(0, 5e-5, 500))
+    lat[[100, 300, 301]] = lat[[99, 299, 299]]
+    lon[[100, 300, 301]] = lon[[99, 299, 299]]
+    return lat, lon
+
+
+@pytest.fixture(params=['numba', 'numpy'])
+def geometry_kernel(request, monkeypatch):
+    """Run step_geometry through the numba kernel or the NumPy fallback"""
+    if request.param == 'numba':
+        if not geo.HAS_NUMBA:
+            pytest.skip("numba is not installed")
+    else:
+        monkeypatch.setattr(geo, 'HAS_NUMBA', False)
+    return request.param
+
+
+@pytest.mark.unit
+class TestStepGeometry:
+    """Test per-step distance, bearing and turning angle"""
+
+    def test_matches_haversine_reference(self, geometry_kernel, gps_track):
+        lat, lon = gps_track
+
+        distance, bearing, _ = geo.step_geometry(lat, lon)
+
+        steps = list(zip(lat[:-1], lon[:-1], lat[1:], lon[1:], strict=True))
+        expected_distance = [_haversine_reference(*step) for step in steps]
+        np.testing.assert_allclose(distance[1:], expected_distance, rtol=1e-9)
+        np.testing.assert_allclose(geo.haversine_km(lat[:-1], lon[:-1], lat[1:], lon[1:]),
+                                   expected_distance, rtol=1e-12)
+
+        moving = distance[1:] > 0
+        expected_bearing = np.array([_bearing_reference(*step) for step in steps])
+        np.testing.assert_allclose(bearing[1:][moving], expected_bearing[moving], atol=1e-9)
+
+    def test_numba_matches_numpy(self, monkeypatch, gps_track):
+        if not geo.HAS_NUMBA:
+            pytest.skip("numba is not installed")
+        lat, lon = gps_track
+
+        numba_result = geo.step_geometry(lat, lon)
+        monkeypatch.setattr(geo, 'HAS_NUMBA', False)
+        numpy_result = geo.step_geometry(lat, lon)
+
+        for numba_values, numpy_values in zip(numba_result, numpy_result, strict=True):
+            assert numba_values.dtype == numpy_values.dtype
+            np.testing.assert_array_equal(np.isnan(numba_values), np.isnan(numpy_values))
+            np.testing.assert_allclose(numba_values, numpy_values, rtol=1e-6, atol=1e-9)
+
+    def test_missing_values(self, geometry_kernel, gps_track):
+        """First points and stationary steps have NaN bearing/turning angle"""
+        lat, lon = gps_track
+
+        distance, bearing, turn = geo.step_geometry(lat, lon)
+
+        assert turn.dtype == np.float32
+        assert np.isnan(distance[0]) and np.isnan(bearing[0])
+        assert np.isnan(turn[:2]).all()
+        assert distance[100] == 0 and np.isnan(bearing[100])
+        assert np.isnan(turn[[100, 101, 300, 301, 302]]).all()
+        assert not np.isnan(turn[[2, 99, 102, 303]]).any()
+
+    # Turning angles are counter-clockwise positive: right turns are negative
+    @pytest.mark.parametrize('headings, expected_turn', [
+        ((350, 10), -20),
+        ((10, 350), 20),
+        ((170, 190), -20),
+        ((190, 170), 20),
+        ((90, 270 - 1e-6), -180),
+        ((0, 90, 180, 270, 0), -90),
+    ])
+    def test_turning_angle_wraps_around(self, geometry_kernel, headings, expected_turn):
+        """Turns across north/south come out as small angles, not as 340 degrees"""
+        lat, lon = _track_from_headings(headings)
+
+        _, _, turn = geo.step_geometry(lat, lon)
+
+        np.testing.assert_allclose(np.degrees(turn[2:]), expected_turn, atol=1e-2)
+
+    @pytest.mark.parametrize('n_points', [0, 1])
+    def test_short_track(self, geometry_kernel, n_points):
+        distance, bearing, turn = geo.step_geometry(np.full(n_points, 47.0), np.full(n_points, 8.0))
+
+        assert len(distance) == len(bearing) == len(turn) == n_points
+        assert np.isnan(distance).all() and np.isnan(turn).all()
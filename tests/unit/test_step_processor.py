@@ -0,0 +1,76 @@
+"""Unit tests for accelerometer step processing"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.processing.step_processor import fft_and_processing, get_steps
+
+FS = 52
+
+
+def _grouped_steps_reference(df, interval_size):
+    """get_steps as originally written, looping over a pd.Grouper time grouping"""
+    df_indexed = df.set_index('time').sort_index()
+    time_l, sample_l, sps_l = [], [], []
+    for timestamp, group in df_indexed.groupby(pd.Grouper(freq=f'{interval_size}s')):
+        time_l.append(timestamp)
+        if group.shape[0] < 3 * FS:
+            sps_l.append(0)
+            sample_l.append(0)
+            continue
+        sps_l.append(fft_and_processing(group.reset_index(), start=0, interval_seconds=interval_size))
+        sample_l.append(len(group) // 2)
+    return pd.DataFrame({"time": time_l, "sample": sample_l, "sps": sps_l})
+
+
+@pytest.fixture
+def walking_data():
+    """Walking-like magnitude at 52 Hz starting exactly on a bin edge, with a gap and NaT rows"""
+    rng = np.random.default_rng(0)
+    n_samples = 60 * FS
+    offsets = pd.to_timedelta(np.arange(n_samples) / FS, unit='s')
+    # 25 s without data after the first 20 s
+    offsets = offsets.where(offsets < pd.Timedelta(seconds=20), offsets + pd.Timedelta(seconds=25))
+    time = pd.Timestamp('2025-03-15 10:00:00') + offsets
+    magnitude = 600 * np.sin(2 * np.pi * 1.8 * np.arange(n_samples) / FS) + rng.normal(0, 50, n_samples)
+
+    df = pd.DataFrame({'time': time, 'magnitude': magnitude})
+    df.loc[[5, 700, n_samples - 1], 'time'] = pd.NaT
+    return df
+
+
+@pytest.mark.unit
+class TestGetSteps:
+    """Test time binning of get_steps against the pd.Grouper implementation"""
+
+    @pytest.mark.parametrize('interval_size', [8, 7])
+    @pytest.mark.parametrize('tz', [None, 'Europe/Zurich'])
+    def test_matches_grouper_bins(self, walking_data, tz, interval_size):
+        if tz is not None:
+            walking_data['time'] = walking_data['time'].dt.tz_localize(tz)
+        edge = walking_data['time'].iloc[0] + pd.Timedelta(seconds=interval_size)
+        assert (walking_data['time'] == edge).any()
+
+        result = get_steps(walking_data.copy(), interval_size)
+        expected = _grouped_steps_reference(walking_data.copy(), interval_size)
+
+        pd.testing.assert_frame_equal(result, expected, check_exact=True)
+        assert (result['sps'] == 0).any() and (result['sps'] > 0).any()
+
+    def test_unaligned_start(self, walking_data):
+        """Bins stay anchored at midnight when the first sample is off the grid"""
+        walking_data['time'] += pd.Timedelta(seconds=3.3)
+
+        pd.testing.assert_frame_equal(
+            get_steps(walking_data.copy()), _grouped_steps_reference(walking_data.copy(), 8),
+            check_exact=True
+        )
+
+    def test_only_missing_timestamps(self, walking_data):
+        walking_data['time'] = pd.NaT
+
+        result = get_steps(walking_data.copy())
+
+        assert result.empty
+        assert list(result.columns) == ['time', 'sample', 'sps']
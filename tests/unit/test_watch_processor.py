@@ -0,0 +1,167 @@
+"""Unit tests for watch data output"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.processing import watch_processor
+from src.processing.geo import step_geometry
+from src.processing.watch_processor import (
+    GPS_PARQUET_DTYPES,
+    TIMESERIES_PARQUET_DTYPES,
+    WatchDataProcessor,
+)
+
+# Column order of the files written before output was streamed per participant
+OLD_TIMESERIES_COLUMNS = [
+    'march_id', 'user_id', 'timestamp', 'timestamp_minutes', 'heart_rate', 'steps',
+    'speed_kmh', 'cumulative_distance_km',
+]
+OLD_GPS_COLUMNS = [
+    'march_id', 'user_id', 'timestamp_minutes', 'latitude', 'longitude', 'altitude', 'speed_kmh',
+]
+
+
+@pytest.fixture
+def processor(tmp_path):
+    return WatchDataProcessor(data_dir=tmp_path, march_id=1)
+
+
+@pytest.fixture
+def participant_results():
+    """One participant with GPS and integer measurements, one without GPS or speed/distance"""
+    timestamps = pd.date_range('2024-03-01 07:59:00', periods=6, freq='30s')
+    minutes = (timestamps - pd.Timestamp('2024-03-01 08:00:00')).total_seconds() / 60
+    with_gps = {
+        'march_id': 1,
+        'participant_id': 'SM001',
+        'aggregate_metrics': {'avg_hr': 120.5, 'total_distance_km': 0.5},
+        'hr_zones': {'light_percent': 100.0},
+        'timeseries': pd.DataFrame({
+            'timestamp': timestamps,
+            'timestamp_minutes': minutes,
+            'heart_rate': [95, 101, 110, 118, 121, 125],
+            'steps': [0, 30, 62, 95, 130, 160],
+            'speed_kmh': [0.0, 4.5, 5.0, 5.25, 5.5, 5.0],
+            'cumulative_distance_km': [0.0, 0.04, 0.08, 0.125, 0.17, 0.21],
+            'cadence': [0, 60, 64, 66, 70, 60],
+        }),
+        'gps_positions': pd.DataFrame({
+            'timestamp_minutes': minutes,
+            'latitude': [47.3700, 47.3701, 47.3703, 47.3705, 47.3705, 47.3706],
+            'longitude': [8.5400, 8.5401, 8.5401, 8.5402, 8.5402, 8.5404],
+            'altitude': [408.0, 409.5, 410.0, 411.0, 411.0, 412.5],
+            'speed_kmh': [0.0, 4.5, 5.0, 5.25, 0.0, 5.0],
+        }),
+    }
+    without_gps = {
+        'march_id': 1,
+        'participant_id': 'SM002',
+        'aggregate_metrics': {'avg_hr': 131.0},
+        'timeseries': pd.DataFrame({
+            'timestamp': timestamps[2:],
+            'timestamp_minutes': minutes[2:],
+            'heart_rate': np.array([130.0, np.nan, 133.0, 135.0], dtype=np.float32),
+            'steps': [10.0, 40.0, 70.0, 101.0],
+        }),
+        'gps_positions': None,
+    }
+    return [with_gps, without_gps]
+
+
+def _concat_reference(results, key, columns):
+    """Concatenate and filter the per-participant frames the way save_to_csv used to"""
+    results = [r for r in results if r.get(key) is not None and not r[key].empty]
+    lengths = [len(r[key]) for r in results]
+    combined = pd.concat([r[key] for r in results], ignore_index=True)
+    combined['march_id'] = np.repeat(np.array([r['march_id'] for r in results], dtype=np.int64), lengths)
+    combined['user_id'] = np.repeat(np.array([r['participant_id'] for r in results], dtype=object), lengths)
+    combined = combined[[col for col in columns if col in combined.columns]]
+    return combined[combined['timestamp_minutes'] >= 0].reset_index(drop=True)
+
+
+def _timeseries_reference(results):
+    return _concat_reference(results, 'timeseries', OLD_TIMESERIES_COLUMNS)
+
+
+def _gps_reference(results):
+    gps = _concat_reference(results, 'gps_positions', OLD_GPS_COLUMNS).rename(columns={'altitude': 'elevation'})
+    _, gps['bearing'], gps['turning_angle'] = step_geometry(gps['latitude'], gps['longitude'])
+    return gps
+
+
+@pytest.mark.unit
+class TestSaveOutput:
+    """Test that streamed output matches concatenating all participants first"""
+
+    @pytest.mark.parametrize('has_pyarrow', [True, False])
+    def test_csv_round_trip(self, processor, participant_results, tmp_path, monkeypatch, has_pyarrow):
+        monkeypatch.setattr(watch_processor, 'HAS_PYARROW', has_pyarrow)
+        processor.save_to_csv(participant_results, tmp_path / 'out', output_format='csv')
+
+        for name, reference in [
+            ('march_timeseries_data', _timeseries_reference(participant_results)),
+            ('march_gps_positions', _gps_reference(participant_results)),
+        ]:
+            # save_to_csv used to write the concatenated frame with to_csv
+            written = (tmp_path / 'out' / f'{name}.csv').read_text()
+            assert written == reference.to_csv(index=False)
+
+        timeseries = pd.read_csv(tmp_path / 'out' / 'march_timeseries_data.csv')
+        assert set(timeseries['user_id']) == {'SM001', 'SM002'}
+        assert timeseries.loc[timeseries['user_id'] == 'SM002', 'speed_kmh'].isna().all()
+
+    def test_csv_subsecond_timestamps(self, processor, participant_results, tmp_path):
+        """One sub-second timestamp gives every timestamp in the file milliseconds"""
+        participant_results[1]['timeseries'].loc[1, 'timestamp'] += pd.Timedelta('250ms')
+        processor.save_to_csv(participant_results, tmp_path, output_format='csv')
+
+        written = (tmp_path / 'march_timeseries_data.csv').read_text()
+        assert written == _timeseries_reference(participant_results).to_csv(index=False)
+        assert written.splitlines()[1].startswith('1,SM001,2024-03-01 08:00:00.000,')
+
+    @pytest.mark.parametrize('has_pyarrow', [True, False])
+    def test_csv_text_format(self, processor, participant_results, tmp_path, monkeypatch, has_pyarrow):
+        """CSV files keep the DataFrame.to_csv text format the loaders were written against"""
+        monkeypatch.setattr(watch_processor, 'HAS_PYARROW', has_pyarrow)
+        processor.save_to_csv(participant_results, tmp_path, output_format='csv')
+
+        metrics = pd.DataFrame([
+            {'march_id': 1, 'user_id': 'SM001', 'avg_hr': 120.5, 'total_distance_km': 0.5},
+            {'march_id': 1, 'user_id': 'SM002', 'avg_hr': 131.0},
+        ])
+        assert (tmp_path / 'march_health_metrics.csv').read_text() == metrics.to_csv(index=False)
+
+        lines = (tmp_path / 'march_timeseries_data.csv').read_text().splitlines()
+        assert lines[0] == ','.join(OLD_TIMESERIES_COLUMNS)
+        assert lines[1] == '1,SM001,2024-03-01 08:00:00,0.0,110.0,62.0,5.0,0.08'
+        assert lines[-1] == '1,SM002,2024-03-01 08:01:30,1.5,135.0,101.0,,'
+
+    @pytest.mark.parametrize('subsecond', [False, True])
+    def test_polars_engine_csv_matches_pandas(self, processor, participant_results, tmp_path, subsecond):
+        pytest.importorskip("polars")
+        if subsecond:
+            participant_results[1]['timeseries'].loc[1, 'timestamp'] += pd.Timedelta('250ms')
+        for engine in ('pandas', 'polars'):
+            processor.save_to_csv(participant_results, tmp_path / engine, engine=engine)
+
+        for name in ('march_timeseries_data', 'march_gps_positions'):
+            polars_text = (tmp_path / 'polars' / f'{name}.csv').read_text()
+            assert polars_text == (tmp_path / 'pandas' / f'{name}.csv').read_text()
+
+    def test_parquet_round_trip(self, processor, participant_results, tmp_path):
+        pq = pytest.importorskip("pyarrow.parquet")
+        processor.save_to_csv(participant_results, tmp_path / 'out', output_format='parquet')
+
+        for name, reference, parquet_dtypes in [
+            ('march_timeseries_data', _timeseries_reference(participant_results),
+             TIMESERIES_PARQUET_DTYPES),
+            ('march_gps_positions', _gps_reference(participant_results), GPS_PARQUET_DTYPES),
+        ]:
+            output_file = tmp_path / 'out' / f'{name}.parquet'
+            expected = processor._downcast(reference, parquet_dtypes)
+            written = pd.read_parquet(output_file)
+
+            assert pq.read_schema(output_file).names == list(reference.columns)
+            assert written.dtypes.to_dict() == expected.dtypes.to_dict()
+            pd.testing.assert_frame_equal(written, expected, check_exact=False, rtol=1e-6)